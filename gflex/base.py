@@ -22,7 +22,13 @@ import sys, os
 from six.moves import configparser
 import numpy as np
 import time # For efficiency counting
+try:
+  from time import perf_counter
+except ImportError:
+  # Python 2
+  from time import time as perf_counter
 import types # For flow control
+import inspect
 from matplotlib import pyplot as plt
 import warnings
 from _version import __version__
@@ -88,6 +94,60 @@ class Utility(object):
           print(specialReturnMessage)
         sys.exit("Exiting.")
 
+  # Inputs from which the finite difference coefficient matrix is built
+  _coeff_matrix_inputs = ('Te', 'dx', 'dy', 'E', 'nu', 'drho', 'g',
+                          'BC_W', 'BC_E', 'BC_N', 'BC_S', 'PlateSolutionType',
+                          'sigma_xx', 'sigma_yy', 'sigma_xy',
+                          # the storage format depends on the solver
+                          'Solver')
+  # Fingerprint of those inputs for the last coefficient matrix built
+  _coeff_matrix_key = None
+
+  def coeff_matrix_fingerprint(self):
+    """
+    Fingerprint of the inputs to the finite difference coefficient matrix,
+    so that a matrix can be reused for as long as they stay the same (e.g.,
+    for time-variable loads or iteration): arrays (i.e., Te) are represented 
+    by a hash of their contents
+    """
+    key = [self.qs.shape]
+    for name in self._coeff_matrix_inputs:
+      value = getattr(self, name, None)
+      if isinstance(value, np.ndarray):
+        value = (value.shape, value.dtype.str, hash(value.tobytes()))
+      key.append(value)
+    return tuple(key)
+
+  def iterative_solve(self, solver, A, b, fallback=None, **kwargs):
+    """
+    x = iterative_solve(solver, A, b, fallback=None, **kwargs)
+
+    Solves A x = b with a scipy.sparse.linalg iterative solver (e.g., cg or
+    lgmres), converging to a residual of self.iterative_ConvergenceTolerance
+    relative to b. If it fails and a fallback solver is given, solves again
+    with that (e.g., lgmres for cg, which fails if A is not positive definite)
+    """
+    # SciPy < 1.12 calls the tolerance "tol", and SciPy >= 1.14 only "rtol"
+    try:
+      parameters = inspect.signature(solver).parameters
+    except AttributeError:
+      # Python 2
+      parameters = inspect.getargspec(solver).args
+    if 'rtol' in parameters:
+      kwargs['rtol'] = self.iterative_ConvergenceTolerance
+    else:
+      kwargs['tol'] = self.iterative_ConvergenceTolerance
+    x, info = solver(A, b, **kwargs)
+    if info != 0 and fallback is not None:
+      if self.Quiet == False:
+        print(solver.__name__, "did not converge: solving again with",
+              fallback.__name__)
+      return self.iterative_solve(fallback, A, b)
+    if info > 0 and self.Quiet == False:
+      print("Iterative solution did not converge to a relative residual of",
+            self.iterative_ConvergenceTolerance, "in", info, "iterations")
+    return x
+
   def readyCoeff(self):
     from scipy import sparse
     if sparse.issparse(self.coeff_matrix):
@@ -861,6 +921,12 @@ class Flexure(Utility, Plotting):
                        +"Exiting.")
           else:
             sys.exit("For a flexural solution, grid must be 1D or 2D. Exiting.")
+        # Periodic boundary conditions come in pairs; checked here, once,
+        # so that the functions that apply them need not check again
+        if self.dimension == 2:
+          if (self.BC_W == 'Periodic') != (self.BC_E == 'Periodic') \
+            or (self.BC_N == 'Periodic') != (self.BC_S == 'Periodic'):
+            sys.exit("Not physical to have one wrap-around boundary but not its pair.")
     else:
       # Analytical solution boundary conditions
       # If they aren't set, it is because no input file has been used
@@ -961,15 +1027,16 @@ class Flexure(Utility, Plotting):
     try:
       self.qs
     except:
-      self.qs = self.q0.copy()
+      self.qs = self.q0 # not copied: q0 is removed below
       # Remove self.q0 to avoid issues with multiply-defined inputs
       # q0 is the parsable input to either a qs grid or contains (x,(y),q)
       del self.q0
     # Give it x and y dimensions for help with plotting tools
     # (not implemented internally, but a help with external methods)
-    self.x = np.arange(self.dx/2., self.dx * self.qs.shape[0], self.dx)
+    # (cell centers; qs is (ny, nx) in 2D, so x runs along its last axis)
+    self.x = (np.arange(self.qs.shape[-1]) + 0.5) * self.dx
     if self.dimension == 2:
-      self.y = np.arange(self.dy/2., self.dy * self.qs.shape[1], self.dy)
+      self.y = (np.arange(self.qs.shape[0]) + 0.5) * self.dy
     # Is there a solver defined
     try:
       self.Solver # See if it exists already
@@ -980,6 +1047,43 @@ class Flexure(Utility, Plotting):
         self.Solver = self.configGet("string", "numerical", "Solver")
       else:
         sys.exit("No solver defined!")
+    # Library for the direct solution: "UMFpack" (default; if scikits.umfpack
+    # is not installed, SciPy falls back to SuperLU) or "SuperLU" (built into
+    # SciPy, and often quicker to factorize these banded matrices)
+    try:
+      self.DirectSolver
+    except:
+      self.DirectSolver = None
+      if self.filename:
+        self.DirectSolver = self.configGet("string", "numerical", "DirectSolver", optional=True)
+      if not self.DirectSolver:
+        self.DirectSolver = "UMFpack"
+    # Preconditioner for the iterative solution of symmetric systems: none
+    # (default) or "multigrid" (requires pyamg; worthwhile for large,
+    # non-periodic grids)
+    try:
+      self.Preconditioner
+    except:
+      self.Preconditioner = None
+      if self.filename:
+        self.Preconditioner = self.configGet("string", "numerical", "Preconditioner", optional=True)
+    # Floating-point type of the iterative 2D finite difference solution. The
+    # coefficient matrix is built in double precision; with np.float32, the
+    # iterations use a single-precision copy of it (half the memory traffic)
+    # and the solution is refined once against the double-precision matrix.
+    # Only used if it is set (e.g., by a setter). Direct and 1D solutions are
+    # always done in double precision, whatever it is set to.
+    try:
+      self.dtype
+    except:
+      self.dtype = np.float64
+    # Residual, relative to the loads, to which an iterative solution is
+    # converged: SciPy's default unless it is set (e.g., by a setter), or
+    # read from the configuration file below
+    try:
+      self.iterative_ConvergenceTolerance
+    except:
+      self.iterative_ConvergenceTolerance = 1E-5
     # Check consistency of size if coeff array was loaded
     if self.filename:
       # In the case that it is iterative, find the convergence criterion
@@ -1042,25 +1146,25 @@ class Flexure(Utility, Plotting):
     method for solving flexure
     """
     if self.x is None:
-      self.x = np.arange(self.dx/2., self.dx * self.qs.shape[0], self.dx)
+      self.x = (np.arange(self.qs.shape[-1]) + 0.5) * self.dx
     if self.filename:
       # Define the (scalar) elastic thickness
       self.Te = self.configGet("float", "input", "ElasticThickness")
       # Define a stress-based qs = q0
-      self.qs = self.q0.copy()
+      self.qs = self.q0 # not copied: q0 is removed below
       # Remove self.q0 to avoid issues with multiply-defined inputs
       # q0 is the parsable input to either a qs grid or contains (x,(y),q)
       del self.q0
     if self.dimension == 2:
       if self.y is None:
-        self.y = np.arange(self.dy/2., self.dy * self.qs.shape[0], self.dy)
+        self.y = (np.arange(self.qs.shape[0]) + 0.5) * self.dy
       # Define a stress-based qs = q0
       # But only if the latter has not already been defined
       # (e.g., by the getters and setters)
       try:
         self.qs
       except:
-        self.qs = self.q0.copy()
+        self.qs = self.q0 # not copied: q0 is removed below
         # Remove self.q0 to avoid issues with multiply-defined inputs
         # q0 is the parsable input to either a qs grid or contains (x,(y),q)
         del self.q0
@@ -1100,7 +1204,7 @@ class Flexure(Utility, Plotting):
       try:
         # If these have already been set, e.g., by getters/setters, great!
         self.x
-        self.u
+        self.y
         self.q
       except:
         # Using [x, y, w] configuration file
@@ -30,7 +30,7 @@ class F1D(Flexure):
 
   def run(self):
     self.bc_check()
-    self.solver_start_time = time.time()
+    self.solver_start_time = perf_counter()
     if self.Method == 'FD':
       # Finite difference
       super(F1D, self).FD()
@@ -54,7 +54,7 @@ class F1D(Flexure):
     if self.Verbose: print("F1D run")
     self.method_func()
 
-    self.time_to_solve = time.time() - self.solver_start_time
+    self.time_to_solve = perf_counter() - self.solver_start_time
     if self.Quiet == False:
       print("Time to solve [s]:", self.time_to_solve)
 
@@ -79,8 +79,16 @@ class F1D(Flexure):
     if self.coeff_matrix is not None:
       pass
     else:
-      self.elasprepFD() # define dx4 and D within self
-      self.BC_selector_and_coeff_matrix_creator()
+      # or if the last one built (which finalize() lets go of) was built
+      # from the very same inputs
+      coeff_matrix_key = self.coeff_matrix_fingerprint()
+      if coeff_matrix_key == self._coeff_matrix_key:
+        self.coeff_matrix = self._coeff_matrix_last
+      else:
+        self.elasprepFD() # define dx4 and D within self
+        self.BC_selector_and_coeff_matrix_creator()
+        self._coeff_matrix_key = coeff_matrix_key
+        self._coeff_matrix_last = self.coeff_matrix
     self.fd_solve() # Get the deflection, "w"
 
   def FFT(self):
@@ -196,7 +204,7 @@ class F1D(Flexure):
     """
     
     # Zeroth, start the timer and print the boundary conditions to the screen
-    self.coeff_start_time = time.time()
+    self.coeff_start_time = perf_counter()
     if self.Verbose:
       print("Boundary condition, West:", self.BC_W, type(self.BC_W))
       print("Boundary condition, East:", self.BC_E, type(self.BC_E))
@@ -216,10 +224,15 @@ class F1D(Flexure):
     self.build_diagonals()
     
     # Finally, compute the total time this process took    
-    self.coeff_creation_time = time.time() - self.coeff_start_time
+    self.coeff_creation_time = perf_counter() - self.coeff_start_time
     if self.Quiet == False:
       print("Time to construct coefficient (operator) array [s]:", self.coeff_creation_time)
 
+  # Boundary conditions under which the rigidity is extended off of the
+  # grid with zero curvature, and the ones that BC_Rigidity was last run for
+  _BC_Rigidity_0curvature = frozenset(['0Displacement0Slope', '0Moment0Shear', '0Slope0Shear'])
+  _BC_Rigidity_key = None
+
   def BC_Rigidity(self):
     """
     Utility function to help implement boundary conditions by specifying 
@@ -229,24 +242,21 @@ class F1D(Flexure):
     #########################################
     # FLEXURAL RIGIDITY BOUNDARY CONDITIONS #
     #########################################
-    # West
-    if self.BC_W == 'Periodic':
-      self.BC_Rigidity_W = 'periodic'
-    elif (self.BC_W == np.array(['0Displacement0Slope', '0Moment0Shear', '0Slope0Shear'])).any():
-      self.BC_Rigidity_W = '0 curvature'
-    elif self.BC_W == 'Mirror':
-      self.BC_Rigidity_W = 'mirror symmetry'
-    else:
-      sys.exit("Invalid Te B.C. case")
-    # East
-    if self.BC_E == 'Periodic':
-      self.BC_Rigidity_E = 'periodic'
-    elif (self.BC_E == np.array(['0Displacement0Slope', '0Moment0Shear', '0Slope0Shear'])).any():
-      self.BC_Rigidity_E = '0 curvature'
-    elif self.BC_E == 'Mirror':
-      self.BC_Rigidity_E = 'mirror symmetry'
-    else:
-      sys.exit("Invalid Te B.C. case")
+    # These only change when the boundary conditions do, so skip this when
+    # run() is called again with the same ones
+    BC_key = (self.BC_W, self.BC_E)
+    if BC_key != self._BC_Rigidity_key:
+      for side, bc in zip('WE', BC_key):
+        if bc == 'Periodic':
+          BC_Rigidity = 'periodic'
+        elif bc in self._BC_Rigidity_0curvature:
+          BC_Rigidity = '0 curvature'
+        elif bc == 'Mirror':
+          BC_Rigidity = 'mirror symmetry'
+        else:
+          sys.exit("Invalid Te B.C. case")
+        setattr(self, 'BC_Rigidity_'+side, BC_Rigidity)
+      self._BC_Rigidity_key = BC_key
     
     #############
     # PAD ARRAY #
@@ -584,10 +594,9 @@ class F1D(Flexure):
     case, the flexural wavelength is a good characteristic distance for any 
     truncation limit
     """
-    if np.isscalar(self.D):
-      Dmax = self.D
-    else:
-      Dmax = self.D.max()
+    # (np.max also takes a scalar D; a Python float keeps the arithmetic
+    # below out of NumPy)
+    Dmax = float(np.max(self.D))
     # This is an approximation if there is fill that evolves with iterations 
     # (e.g., water), but should be good enough that this won't do much to it
     alpha = (4*Dmax/(self.drho*self.g))**.25 # 2D flexural parameter
@@ -613,11 +622,14 @@ class F1D(Flexure):
       if self.Debug:
         print("Using generalized minimal residual method for iterative solution")
       if self.Verbose:
-        print("Converging to a tolerance of", self.iterative_ConvergenceTolerance, "m between iterations")
+        print("Converging to a relative residual of", self.iterative_ConvergenceTolerance)
+      # The 1D matrices are small: unlike in 2D, the iterations are always
+      # done in double precision
+      if np.dtype(self.dtype) != np.float64 and self.Quiet == False:
+        print("1D solution is done in double precision: using np.float64")
       # qs negative so bends down with positive load, bends up with neative load 
       # (i.e. material removed)
-      w = isolve.lgmres(self.coeff_matrix, -self.qs, tol=self.iterative_ConvergenceTolerance)  
-      self.w = w[0] # Reach into tuple to get my array back
+      self.w = self.iterative_solve(isolve.lgmres, self.coeff_matrix, -self.qs)
     else:
       if self.Solver == 'direct' or self.Solver == 'Direct':
         if self.Debug:
@@ -626,10 +638,11 @@ class F1D(Flexure):
         print("Solution type not understood:")
         print("Defaulting to direct solution with UMFpack")
       # UMFpack is now the default, but setting true just to be sure in case
-      # anything changes
+      # anything changes (unless SuperLU has been chosen as the DirectSolver)
       # qs negative so bends down with positive load, bends up with neative load 
       # (i.e. material removed)
-      self.w = spsolve(self.coeff_matrix, -self.qs, use_umfpack=True)
+      use_umfpack = (self.DirectSolver != "SuperLU" and self.DirectSolver != "superlu")
+      self.w = spsolve(self.coeff_matrix, -self.qs, use_umfpack=use_umfpack)
     
     if self.Debug:
       print("w.shape:")
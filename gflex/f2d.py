@@ -21,6 +21,7 @@ from __future__ import division, print_function # No automatic floor division
 from base import *
 import scipy
 from scipy.special import kei
+from scipy.signal import fftconvolve
 
 # class F2D inherits Flexure and overrides __init__ therefore setting up the same
 # three parameters as class Isostasy; and it then sets up more parameters specific
@@ -29,11 +30,31 @@ class F2D(Flexure):
   def initialize(self, filename=None):
     self.dimension = 2 # Set it here in case it wasn't set for selection before
     super(F2D, self).initialize()
+    # Unit-load solution for the gridded SAS method, kept between runs
+    self._biggrid = None
+    self._biggrid_key = None
+    # Arrays for the FD coefficients with b.c.'s, kept between runs
+    self._scratch_buffers = {}
+    # Offsets of the FD coefficient matrix diagonals, kept between runs
+    self._offsets_key = None
+    # Factorization of the last FD coefficient matrix solved directly
+    self._factorized_matrix = None
+    self._factorized_solve = None
+    self._factorized_with = None
+    # Whether the last FD coefficient matrix solved iteratively is symmetric
+    self._symmetry_checked_matrix = None
+    self._symmetric = None
+    # Multigrid preconditioner (pyamg) for the last FD coefficient matrix
+    self._multigrid_matrix = None
+    self._multigrid = None
+    # Copy of the FD coefficient matrix in self.dtype for the iterations
+    self._iteration_matrix_of = None
+    self._iteration_matrix = None
     if self.Verbose: print("F2D initialized")
 
   def run(self):
     self.bc_check()
-    self.solver_start_time = time.time()
+    self.solver_start_time = perf_counter()
       
     if self.Method == 'FD':
       # Finite difference
@@ -58,7 +79,7 @@ class F2D(Flexure):
     if self.Verbose: print("F2D run")
     self.method_func()
 
-    self.time_to_solve = time.time() - self.solver_start_time
+    self.time_to_solve = perf_counter() - self.solver_start_time
     if self.Quiet == False:
       print("Time to solve [s]:", self.time_to_solve)
 
@@ -82,8 +103,16 @@ class F2D(Flexure):
     if self.coeff_matrix is not None:
       pass
     else:
-      self.elasprep()
-      self.BC_selector_and_coeff_matrix_creator()
+      # or if the last one built (which finalize() lets go of) was built
+      # from the very same inputs
+      coeff_matrix_key = self.coeff_matrix_fingerprint()
+      if coeff_matrix_key == self._coeff_matrix_key:
+        self.coeff_matrix = self._coeff_matrix_last
+      else:
+        self.elasprep()
+        self.BC_selector_and_coeff_matrix_creator()
+        self._coeff_matrix_key = coeff_matrix_key
+        self._coeff_matrix_last = self.coeff_matrix
     self.fd_solve()
 
   def FFT(self):
@@ -133,37 +162,84 @@ class F2D(Flexure):
   # GRIDDED
 
   def spatialDomainGridded(self):
-  
+
     self.nx = self.qs.shape[1]
     self.ny = self.qs.shape[0]
-    
-    # Prepare a large grid of solutions beforehand, so we don't have to
-    # keep calculating kei (time-intensive!)
-    # This pre-prepared solution will be for a unit load
-    bigshape = 2*self.ny+1,2*self.nx+1 # Tuple shape
 
-    dist_ny = np.arange(bigshape[0]) - self.ny
-    dist_nx = np.arange(bigshape[1]) - self.nx
+    # The unit-load solution depends only on the grid and on the plate, so
+    # keep it between runs (e.g., for time-variable or iterative loads)
+    biggrid_key = (self.ny, self.nx, self.dx, self.dy, self.alpha, self.coeff)
+    if self._biggrid_key != biggrid_key:
+      self._biggrid = self.spatialDomainUnitLoad()
+      self._biggrid_key = biggrid_key
+    biggrid = self._biggrid
+
+    # Now compute the deflections
+    # Only visit the cells that actually hold loads
+    js, iis = np.nonzero(self.qs)
+    # Summing shifted copies of "biggrid" costs ~(number of loads)*nx*ny;
+    # an FFT convolution costs ~N*log2(N) over the (3ny, 3nx) padded grid
+    nfft = 9*self.nx*self.ny
+    if js.size * self.nx * self.ny < nfft * np.log2(nfft):
+      # Load must be multiplied by grid cell size
+      q = self.qs[js,iis] * self.dx * self.dy
+      self.w = np.zeros((self.ny,self.nx)) # Deflection array
+      for k in range(js.size):
+        j = js[k]
+        i = iis[k]
+        # Solve by summing portions of "biggrid" while moving origin
+        # to location of current cell
+        self.w += q[k] * biggrid[self.ny-j:2*self.ny-j,self.nx-i:2*self.nx-i]
+    else:
+      # The superposition is a convolution of the loads with the unit-load
+      # solution, centered at [ny,nx]; do it all at once by FFT.
+      # Load must be multiplied by grid cell size
+      self.w = self.dx * self.dy * fftconvolve(self.qs, biggrid, mode='same')
+    # No need to return: w already belongs to "self"
 
-    dist_x,dist_y = np.meshgrid(dist_nx*self.dx,dist_ny*self.dy)
+  def spatialDomainUnitLoad(self):
+    """
+    biggrid = spatialDomainUnitLoad()
 
-    bigdist = np.sqrt(dist_x**2 + dist_y**2) # Distances from center
-                                          # Center at [ny,nx]
-    
-    biggrid = self.coeff * kei(bigdist/self.alpha) # Kelvin fcn solution
+    Deflection due to a unit load at [ny,nx] on a (2*ny+1, 2*nx+1) grid,
+    to be shifted to and scaled by each load in spatialDomainGridded
+    """
 
-    # Now compute the deflections
-    self.w = np.zeros((self.ny,self.nx)) # Deflection array
-    for i in range(self.nx):
-      for j in range(self.ny):
-        # Loop over locations that have loads, and sum
-        if self.qs[j,i]:
-          # Solve by summing portions of "biggrid" while moving origin
-          # to location of current cell
-          # Load must be multiplied by grid cell size
-          self.w += self.qs[j,i] * self.dx * self.dy \
-             * biggrid[self.ny-j:2*self.ny-j,self.nx-i:2*self.nx-i]
-      # No need to return: w already belongs to "self"
+    # Prepare a large grid of solutions beforehand, so we don't have to
+    # keep calculating kei (time-intensive!)
+    # This pre-prepared solution will be for a unit load, centered at [ny,nx]
+    # and of shape (2*ny+1, 2*nx+1).
+    # Distances from the center depend only on the absolute x and y offsets,
+    # so kei need only be evaluated on one quadrant, which is then mirrored.
+    # It is filled in place: kei is evaluated straight into the quadrant
+    # (a view into the full grid), which is then copied into the other three,
+    # so that the only full-size array is the one that is returned.
+    biggrid = np.empty((2*self.ny+1, 2*self.nx+1))
+    quadrant = biggrid[self.ny:, self.nx:]
+    # Distances in units of alpha
+    dist_y = np.arange(self.ny+1) * (self.dy/self.alpha)
+    dist_x = np.arange(self.nx+1) * (self.dx/self.alpha)
+    if self.dx == self.dy:
+      # Square cells: the quadrant is also symmetric across its diagonal, so
+      # only one octant of the square part of it needs to be evaluated
+      n = min(self.ny, self.nx) + 1
+      iu = np.triu_indices(n)
+      # Many of its cells are also at the same distance from the center
+      # (e.g., 3**2 + 4**2 == 5**2 + 0**2): count distances in cells, exactly,
+      # and evaluate kei only once for each of them
+      r2_unique, r2_index = np.unique(iu[0]**2 + iu[1]**2, return_inverse=True)
+      quadrant[iu] = kei(np.sqrt(r2_unique)*dist_x[1])[r2_index]
+      quadrant[iu[1], iu[0]] = quadrant[iu]
+      # And the rest of the quadrant, if it is not square
+      kei(np.hypot(dist_y[n:,np.newaxis], dist_x), out=quadrant[n:,:])
+      kei(np.hypot(dist_y[:n,np.newaxis], dist_x[n:]), out=quadrant[:n,n:])
+    else:
+      kei(np.hypot(dist_y[:,np.newaxis], dist_x), out=quadrant)
+    quadrant *= self.coeff # Kelvin fcn solution
+    # Mirror into the other three quadrants
+    biggrid[self.ny:, :self.nx] = quadrant[:, :0:-1]
+    biggrid[:self.ny, :] = biggrid[:self.ny:-1, :]
+    return biggrid
 
   # NO GRID
 
@@ -174,21 +250,30 @@ class F2D(Flexure):
       print("w = ")
       print(self.w.shape)
     
-    if self.latlon:
-      for i in range(len(self.x)):
-        # More efficient if we have created some 0-load points
-        # (e.g., for where we want output)
-        if self.q[i] != 0:
-          # Create array of distances from point of load
-          r = self.greatCircleDistance(lat1=self.y[i], long1=self.x[i], lat2=self.yw, long2=self.xw, radius=self.PlanetaryRadius)
-          self.w += self.q[i] * self.coeff * kei(r/self.alpha)
-          # Compute and sum deflection
-          self.w += self.q[i] * self.coeff * kei(r/self.alpha)
-    else:
-      for i in range(len(self.x)):
-        if self.q[i] != 0:
-          r = ( (self.xw - self.x[i])**2 + (self.yw - self.y[i])**2 )**.5
-          self.w += self.q[i] * self.coeff * kei(r/self.alpha)
+    # More efficient if we have created some 0-load points
+    # (e.g., for where we want output): skip them entirely
+    loaded = self.q != 0
+    x = self.x[loaded]
+    y = self.y[loaded]
+    q = self.q[loaded]
+    # Output points down the rows, loads across the columns
+    xw = self.xw.reshape(-1, 1)
+    yw = self.yw.reshape(-1, 1)
+
+    # Work through the loads in blocks: each block builds one dense array of
+    # distances from every output point to every load in it, so the kei
+    # evaluation and the sum over loads both happen in compiled code instead
+    # of allocating several full-size temporaries per load
+    nblock = max(1, 2**20 // max(xw.size, 1))
+    w = np.zeros(xw.size)
+    for k in range(0, q.size, nblock):
+      if self.latlon:
+        r = self.greatCircleDistance(lat1=y[k:k+nblock], long1=x[k:k+nblock], lat2=yw, long2=xw, radius=self.PlanetaryRadius)
+      else:
+        r = np.hypot(xw - x[k:k+nblock], yw - y[k:k+nblock])
+      # Compute and sum deflection
+      w += kei(r/self.alpha).dot(q[k:k+nblock])
+    self.w += self.coeff * w.reshape(self.w.shape)
 
   ## FINITE DIFFERENCE
   ######################
@@ -221,17 +306,22 @@ class F2D(Flexure):
     
     The method is spread across the subroutines here.
     
-    Important to this is the use of np.roll() to properly offset the 
-    diagonals that end up in the main matrix: spdiags() will put each vector
-    on the proper diagonal, but will align them such that their first cell is 
-    along the first column, instead of using a 45 degrees to matrix corner 
-    baseline that would stagger them appropriately for this solution method.
-    Therefore, np.roll() effectively does this staggering by having the 
-    appropriate cell in the vector start at the first column.
+    Important to this is the staggering of the coefficient arrays on the
+    diagonals that end up in the main matrix. A DIA matrix aligns each
+    diagonal so that its first cell is along the first column, instead of
+    using a 45 degrees to matrix corner baseline that would stagger them
+    appropriately for this solution method. Therefore, build_diagonals
+    (through _fill_diagonals and _roll, with the shifts in _diagonal_shifts)
+    writes each coefficient array, shifted, straight into its row of
+    self.diags, so that the appropriate cell starts at the first column.
+    The diagonals needed for the boundary conditions and their offsets come
+    from _diagonal_layouts. self.diags and the offsets are passed to
+    scipy.sparse.dia_matrix, which is kept as DIA for the iterative solution
+    or converted to CSR for the direct solution.
     """
     
     # Zeroth, start the timer and print the boundary conditions to the screen
-    self.coeff_start_time = time.time()
+    self.coeff_start_time = perf_counter()
     if self.Verbose:
       print("Boundary condition, West:", self.BC_W, type(self.BC_W))
       print("Boundary condition, East:", self.BC_E, type(self.BC_E))
@@ -253,71 +343,74 @@ class F2D(Flexure):
     self.build_diagonals()
 
     # Finally, compute the total time this process took    
-    self.coeff_creation_time = time.time() - self.coeff_start_time
+    self.coeff_creation_time = perf_counter() - self.coeff_start_time
     if self.Quiet == False:
       print("Time to construct coefficient (operator) array [s]:", self.coeff_creation_time)
 
+  # Boundary conditions under which the rigidity is extended off of the
+  # grid with zero curvature, and the ones that BC_Rigidity was last run for
+  _BC_Rigidity_0curvature = frozenset(['0Displacement0Slope', '0Moment0Shear', '0Slope0Shear'])
+  _BC_Rigidity_key = None
+  # np.pad arguments for the rigidity boundary conditions that it can apply
+  # by itself ("periodic" below is not quite np.pad's 'wrap' on the E and S)
+  _BC_Rigidity_pad = {
+    '0 curvature': {'mode': 'reflect', 'reflect_type': 'odd'},
+    'mirror symmetry': {'mode': 'reflect'},
+  }
+
   def BC_Rigidity(self):
     """
     Utility function to help implement boundary conditions by specifying 
     them for and applying them to the elastic thickness grid
     """
 
+    # With a scalar Te, D is uniform and is neither padded nor changed by the
+    # boundary conditions: it only needs to be brought up to the grid size
+    if np.isscalar(self.Te):
+      self.D = np.full(self.qs.shape, self.D) # And leave Te as a scalar for checks
+      return
+
     #########################################
     # FLEXURAL RIGIDITY BOUNDARY CONDITIONS #
     #########################################
-    # West
-    if self.BC_W == 'Periodic':
-      self.BC_Rigidity_W = 'periodic'
-    elif (self.BC_W == np.array(['0Displacement0Slope', '0Moment0Shear', '0Slope0Shear'])).any():
-      self.BC_Rigidity_W = '0 curvature'
-    elif self.BC_W == 'Mirror':
-      self.BC_Rigidity_W = 'mirror symmetry'
-    else:
-      sys.exit("Invalid Te B.C. case")
-    # East
-    if self.BC_E == 'Periodic':
-      self.BC_Rigidity_E = 'periodic'
-    elif (self.BC_E == np.array(['0Displacement0Slope', '0Moment0Shear', '0Slope0Shear'])).any():
-      self.BC_Rigidity_E = '0 curvature'
-    elif self.BC_E == 'Mirror':
-      self.BC_Rigidity_E = 'mirror symmetry'
-    else:
-      sys.exit("Invalid Te B.C. case")
-    # North
-    if self.BC_N == 'Periodic':
-      self.BC_Rigidity_N = 'periodic'
-    elif (self.BC_N == np.array(['0Displacement0Slope', '0Moment0Shear', '0Slope0Shear'])).any():
-      self.BC_Rigidity_N = '0 curvature'
-    elif self.BC_N == 'Mirror':
-      self.BC_Rigidity_N = 'mirror symmetry'
-    else:
-      sys.exit("Invalid Te B.C. case")
-    # South
-    if self.BC_S == 'Periodic':
-      self.BC_Rigidity_S = 'periodic'
-    elif (self.BC_S == np.array(['0Displacement0Slope', '0Moment0Shear', '0Slope0Shear'])).any():
-      self.BC_Rigidity_S = '0 curvature'
-    elif self.BC_S == 'Mirror':
-      self.BC_Rigidity_S = 'mirror symmetry'
-    else:
-      sys.exit("Invalid Te B.C. case")
+    # These only change when the boundary conditions do, so skip this when
+    # run() is called again with the same ones
+    BC_key = (self.BC_W, self.BC_E, self.BC_N, self.BC_S)
+    if BC_key != self._BC_Rigidity_key:
+      for side, bc in zip('WENS', BC_key):
+        if bc == 'Periodic':
+          BC_Rigidity = 'periodic'
+        elif bc in self._BC_Rigidity_0curvature:
+          BC_Rigidity = '0 curvature'
+        elif bc == 'Mirror':
+          BC_Rigidity = 'mirror symmetry'
+        else:
+          sys.exit("Invalid Te B.C. case")
+        setattr(self, 'BC_Rigidity_'+side, BC_Rigidity)
+      self._BC_Rigidity_key = BC_key
   
     #############
     # PAD ARRAY #
     #############
-    if np.isscalar(self.Te):
-      self.D *= np.ones(self.qs.shape) # And leave Te as a scalar for checks
-    else:
-      self.Te_unpadded = self.Te.copy()
-      self.Te = np.hstack(( np.nan*np.zeros((self.Te.shape[0], 1)), self.Te, np.nan*np.zeros((self.Te.shape[0], 1)) ))
-      self.Te = np.vstack(( np.nan*np.zeros(self.Te.shape[1]), self.Te, np.nan*np.zeros(self.Te.shape[1]) ))
-      self.D = np.hstack(( np.nan*np.zeros((self.D.shape[0], 1)), self.D, np.nan*np.zeros((self.D.shape[0], 1)) ))
-      self.D = np.vstack(( np.nan*np.zeros(self.D.shape[1]), self.D, np.nan*np.zeros(self.D.shape[1]) ))
+    self.Te_unpadded = self.Te.copy()
+    self.Te = np.pad(self.Te, 1, mode='constant', constant_values=np.nan)
 
     ###############################################################
     # APPLY FLEXURAL RIGIDITY BOUNDARY CONDITIONS TO PADDED ARRAY #
     ###############################################################
+    BC_Rigidity = set([self.BC_Rigidity_W, self.BC_Rigidity_E,
+                       self.BC_Rigidity_N, self.BC_Rigidity_S])
+    if len(BC_Rigidity) == 1 and BC_Rigidity <= set(self._BC_Rigidity_pad):
+      # The same on all sides: np.pad can do all of the work. Both cases are
+      # linear, so the corners come out the same as they do below
+      self.D = np.pad(self.D, 1, **self._BC_Rigidity_pad[BC_Rigidity.pop()])
+      return
+
+    # Otherwise, every padded value is written below (the rows after the
+    # columns, so the corners too), so what they are padded with does not
+    # matter (mode='empty' would skip filling them, but needs numpy >= 1.17)
+    self.D = np.pad(self.D, 1, mode='constant')
+
     if self.BC_Rigidity_W == "0 curvature":
       self.D[:,0] = 2*self.D[:,1] - self.D[:,2]
     if self.BC_Rigidity_E == "0 curvature":
@@ -378,47 +471,34 @@ class F2D(Flexure):
 
     if np.isscalar(self.Te):
       # So much simpler with constant D! And symmetrical stencil
-      self.cj2i0 = D/dy4
-      self.cj1i_1 = 2*D/dx2dy2 + 2*self.sigma_xy*self.T_e
-      self.cj1i0 = -4*D/dy4 - 4*D/dx2dy2 - self.sigma_yy*self.T_e
-      self.cj1i1 = 2*D/dx2dy2 - 2*self.sigma_xy*self.T_e
-      self.cj0i_2 = D/dx4
-      self.cj0i_1 = -4*D/dx4 - 4*D/dx2dy2 - self.sigma_xx*self.T_e
-      self.cj0i0 = 6*D/dx4 + 6*D/dy4 + 8*D/dx2dy2 + drho*g + 2*self.sigma_xx*self.T_e + 2*self.sigma_yy*self.T_e
-      self.cj0i1 = -4*D/dx4 - 4*D/dx2dy2 - self.sigma_xx*self.T_e # Symmetry
-      self.cj0i2 = D/dx4 # Symmetry
-      self.cj_1i_1 = 2*D/dx2dy2 - 2*self.sigma_xy*self.T_e # Symmetry
-      self.cj_1i0 = -4*D/dy4 - 4*D/dx2dy2 # Symmetry
-      self.cj_1i1 = 2*D/dx2dy2 + 2*self.sigma_xy*self.T_e # Symmetry
-      self.cj_2i0 = D/dy4 # Symmetry
-      # Bring up to size
-      self.cj2i0 *= np.ones(self.qs.shape)
-      self.cj1i_1 *= np.ones(self.qs.shape)
-      self.cj1i0 *= np.ones(self.qs.shape)
-      self.cj1i1 *= np.ones(self.qs.shape)
-      self.cj0i_2 *= np.ones(self.qs.shape)
-      self.cj0i_1 *= np.ones(self.qs.shape)
-      self.cj0i0 *= np.ones(self.qs.shape)
-      self.cj0i1 *= np.ones(self.qs.shape)
-      self.cj0i2 *= np.ones(self.qs.shape)
-      self.cj_1i_1 *= np.ones(self.qs.shape)
-      self.cj_1i0 *= np.ones(self.qs.shape)
-      self.cj_1i1 *= np.ones(self.qs.shape)
-      self.cj_2i0 *= np.ones(self.qs.shape)
-      # Create coefficient arrays to manage boundary conditions
-      self.cj2i0_coeff_ij = self.cj2i0.copy()
-      self.cj1i_1_coeff_ij = self.cj1i_1.copy()
-      self.cj1i0_coeff_ij = self.cj1i0.copy()
-      self.cj1i1_coeff_ij = self.cj1i1.copy()
-      self.cj0i_2_coeff_ij = self.cj0i_2.copy()
-      self.cj0i_1_coeff_ij = self.cj0i_1.copy()
-      self.cj0i0_coeff_ij = self.cj0i0.copy()
-      self.cj0i1_coeff_ij = self.cj0i1.copy()
-      self.cj0i2_coeff_ij = self.cj0i2.copy()
-      self.cj_1i_1_coeff_ij = self.cj_1i_1.copy()
-      self.cj_1i0_coeff_ij = self.cj_1i0.copy()
-      self.cj_1i1_coeff_ij = self.cj_1i1.copy()
-      self.cj_2i0_coeff_ij = self.cj_2i0.copy()
+      # D has been brought up to the size of the grid by BC_Rigidity, but
+      # is uniform, so each coefficient is a single value
+      D = D.flat[0]
+      coeffs = {
+        'cj2i0': D/dx4,
+        'cj1i_1': 2*D/dx2dy2,
+        'cj1i0': -4*D/dx4 - 4*D/dx2dy2,
+        'cj1i1': 2*D/dx2dy2,
+        'cj0i_2': D/dy4,
+        'cj0i_1': -4*D/dy4 - 4*D/dx2dy2,
+        'cj0i0': 6*D/dx4 + 6*D/dy4 + 8*D/dx2dy2 + drho*g,
+        'cj0i1': -4*D/dy4 - 4*D/dx2dy2, # Symmetry
+        'cj0i2': D/dy4, # Symmetry
+        'cj_1i_1': 2*D/dx2dy2, # Symmetry
+        'cj_1i0': -4*D/dx4 - 4*D/dx2dy2, # Symmetry
+        'cj_1i1': 2*D/dx2dy2, # Symmetry
+        'cj_2i0': D/dx4, # Symmetry
+        }
+      for name, value in self.get_coeff_values_stress(self.Te):
+        coeffs[name] += value
+      shape = self.qs.shape
+      for name, value in coeffs.items():
+        # Coefficient arrays to manage boundary conditions: these are only
+        # read from, so they can be read-only views of the single values
+        # instead of full-size arrays
+        setattr(self, name+'_coeff_ij', np.broadcast_to(value, shape))
+        # Bring up to size the arrays into which the b.c.'s will be written
+        setattr(self, name, self._scratch(name, value))
       
     elif type(self.Te) == np.ndarray:
     
@@ -427,840 +507,864 @@ class F2D(Flexure):
       #    "vWC1994" IS THE BEST: LOOSEST ASSUMPTIONS.      #
       #        OTHERS HERE LARGELY FOR COMPARISON           #
       #######################################################
-      
-      # All derivatives here, to make reading the equations below easier
-      D00 = D[1:-1,1:-1]
-      D10 = D[1:-1,2:]
-      D_10 = D[1:-1,:-2]
-      D01 = D[2:,1:-1]
-      D0_1 = D[:-2,1:-1]
-      D11 = D[2:,2:]
-      D_11 = D[2:,:-2]
-      D1_1 = D[:-2,2:]
-      D_1_1 = D[:-2,:-2]
-      # Derivatives of D -- not including /(dx^a dy^b)
-      D0  = D00
-      Dx  = (-D_10 + D10)/2.
-      Dy  = (-D0_1 + D01)/2.
-      Dxx = (D_10 - 2.*D00 + D10)
-      Dyy = (D0_1 - 2.*D00 + D01)
-      Dxy = (D_1_1 - D_11 - D1_1 + D11)/4.
-      
+
       if self.PlateSolutionType == 'vWC1994':
-        # van Wees and Cloetingh (1994) solution, re-discretized by me
-        # using a central difference approx. to 2nd order precision
-        # NEW STENCIL
-        # x = -2, y = 0
-        self.cj_2i0_coeff_ij = (D0 - Dx) / dx4
-        # x = 0, y = -2
-        self.cj0i_2_coeff_ij = (D0 - Dy) / dy4
-        # x = 0, y = 2
-        self.cj0i2_coeff_ij = (D0 + Dy) / dy4
-        # x = 2, y = 0
-        self.cj2i0_coeff_ij = (D0 + Dx) / dx4
-        # x = -1, y = -1
-        self.cj_1i_1_coeff_ij = (2.*D0 - Dx - Dy + Dxy*(1-nu)/2.) / dx2dy2
-        # x = -1, y = 1
-        self.cj_1i1_coeff_ij = (2.*D0 - Dx + Dy - Dxy*(1-nu)/2.) / dx2dy2
-        # x = 1, y = -1
-        self.cj1i_1_coeff_ij = (2.*D0 + Dx - Dy - Dxy*(1-nu)/2.) / dx2dy2
-        # x = 1, y = 1
-        self.cj1i1_coeff_ij = (2.*D0 + Dx + Dy + Dxy*(1-nu)/2.) / dx2dy2
-        # x = -1, y = 0
-        self.cj_1i0_coeff_ij = (-4.*D0 + 2.*Dx + Dxx)/dx4 + (-4.*D0 + 2.*Dx + nu*Dyy)/dx2dy2
-        # x = 0, y = -1
-        self.cj0i_1_coeff_ij = (-4.*D0 + 2.*Dy + Dyy)/dy4 + (-4.*D0 + 2.*Dy + nu*Dxx)/dx2dy2
-        # x = 0, y = 1
-        self.cj0i1_coeff_ij = (-4.*D0 - 2.*Dy + Dyy)/dy4 + (-4.*D0 - 2.*Dy + nu*Dxx)/dx2dy2
-        # x = 1, y = 0
-        self.cj1i0_coeff_ij = (-4.*D0 - 2.*Dx + Dxx)/dx4 + (-4.*D0 - 2.*Dx + nu*Dyy)/dx2dy2
-        # x = 0, y = 0
-        self.cj0i0_coeff_ij = (6.*D0 - 2.*Dxx)/dx4 \
-                     + (6.*D0 - 2.*Dyy)/dy4 \
-                     + (8.*D0 - 2.*nu*Dxx - 2.*nu*Dyy)/dx2dy2 \
-                     + drho*g
-                     
+        self.get_coeff_values_vWC1994()
       elif self.PlateSolutionType == 'G2009':
-        # STENCIL FROM GOVERS ET AL. 2009 -- first-order differences
-        # x is j and y is i b/c matrix row/column notation
-        # Note that this breaks down with b.c.'s that place too much control 
-        # on the solution -- harmonic wavetrains
-        # x = -2, y = 0
-        self.cj_2i0_coeff_ij = D_10/dx4
-        # x = -1, y = -1
-        self.cj_1i_1_coeff_ij = (D_10 + D0_1)/dx2dy2
-        # x = -1, y = 0
-        self.cj_1i0_coeff_ij = -2. * ( (D0_1 + D00)/dx2dy2 + (D00 + D_10)/dx4 )
-        # x = -1, y = 1
-        self.cj_1i1_coeff_ij = (D_10 + D01)/dx2dy2
-        # x = 0, y = -2
-        self.cj0i_2_coeff_ij = D0_1/dy4
-        # x = 0, y = -1
-        self.cj0i_1_coeff_ij = -2. * ( (D0_1 + D00)/dx2dy2 + (D00 + D0_1)/dy4)
-        # x = 0, y = 0
-        self.cj0i0_coeff_ij = (D10 + 4.*D00 + D_10)/dx4 + (D01 + 4.*D00 + D0_1)/dy4 + (8.*D00/dx2dy2) + drho*g
-        # x = 0, y = 1
-        self.cj0i1_coeff_ij = -2. * ( (D01 + D00)/dy4 + (D00 + D01)/dx2dy2 )
-        # x = 0, y = 2
-        self.cj0i2_coeff_ij = D0_1/dy4
-        # x = 1, y = -1
-        self.cj1i_1_coeff_ij = (D10+D0_1)/dx2dy2
-        # x = 1, y = 0
-        self.cj1i0_coeff_ij = -2. * ( (D10 + D00)/dx4 + (D10 + D00)/dx2dy2 )
-        # x = 1, y = 1
-        self.cj1i1_coeff_ij = (D10 + D01)/dx2dy2
-        # x = 2, y = 0
-        self.cj2i0_coeff_ij = D10/dx4
+        self.get_coeff_values_G2009()
       else:
         sys.exit("Not an acceptable plate solution type. Please choose from:\n"+
                   "* vWC1994\n"+
                   "* G2009\n"+
                   "")
+      # In-plane stresses: the same for either solution type
+      for name, value in self.get_coeff_values_stress(self.Te_unpadded):
+        getattr(self, name+'_coeff_ij')[...] += value
                   
       ################################################################
       # CREATE COEFFICIENT ARRAYS: PLAIN, WITH NO B.C.'S YET APPLIED #
       ################################################################
+      # These start out as the very same arrays: BC_Flexure copies each one
+      # (self._cow) only if it has to write boundary conditions into it
       # x = -2, y = 0
-      self.cj_2i0 = self.cj_2i0_coeff_ij.copy()
+      self.cj_2i0 = self.cj_2i0_coeff_ij
       # x = -1, y = -1
-      self.cj_1i_1 = self.cj_1i_1_coeff_ij.copy()
+      self.cj_1i_1 = self.cj_1i_1_coeff_ij
       # x = -1, y = 0
-      self.cj_1i0 = self.cj_1i0_coeff_ij.copy()
+      self.cj_1i0 = self.cj_1i0_coeff_ij
       # x = -1, y = 1
-      self.cj_1i1 = self.cj_1i1_coeff_ij.copy()
+      self.cj_1i1 = self.cj_1i1_coeff_ij
       # x = 0, y = -2
-      self.cj0i_2 = self.cj0i_2_coeff_ij.copy()
+      self.cj0i_2 = self.cj0i_2_coeff_ij
       # x = 0, y = -1
-      self.cj0i_1 = self.cj0i_1_coeff_ij.copy()
+      self.cj0i_1 = self.cj0i_1_coeff_ij
       # x = 0, y = 0
-      self.cj0i0 = self.cj0i0_coeff_ij.copy()
+      self.cj0i0 = self.cj0i0_coeff_ij
       # x = 0, y = 1
-      self.cj0i1 = self.cj0i1_coeff_ij.copy()
+      self.cj0i1 = self.cj0i1_coeff_ij
       # x = 0, y = 2
-      self.cj0i2 = self.cj0i2_coeff_ij.copy()
+      self.cj0i2 = self.cj0i2_coeff_ij
       # x = 1, y = -1
-      self.cj1i_1 = self.cj1i_1_coeff_ij.copy()
+      self.cj1i_1 = self.cj1i_1_coeff_ij
       # x = 1, y = 0
-      self.cj1i0 = self.cj1i0_coeff_ij.copy()
+      self.cj1i0 = self.cj1i0_coeff_ij
       # x = 1, y = 1
-      self.cj1i1 = self.cj1i1_coeff_ij.copy()
+      self.cj1i1 = self.cj1i1_coeff_ij
       # x = 2, y = 0
-      self.cj2i0 = self.cj2i0_coeff_ij.copy()
+      self.cj2i0 = self.cj2i0_coeff_ij
 
     # Provide rows and columns in the 2D input to later functions
     self.ncolsx = self.cj0i0.shape[1]
     self.nrowsy = self.cj0i0.shape[0]
 
-  def BC_Flexure(self):
-
-    # The next section of code is split over several functions for the 1D 
-    # case, but will be all in one function here, at least for now.
-    
-    # Inf for E-W to separate from nan for N-S. N-S will spill off ends
-    # of array (C order, in rows), while E-W will be internal, so I will
-    # later change np.inf to 0 to represent where internal boundaries 
-    # occur.
-
-    #######################################################################
-    # DEFINE COEFFICIENTS TO W_j-2 -- W_j+2 WITH B.C.'S APPLIED (x: W, E) #
-    #######################################################################
-    
-    # Infinitiy is used to flag places where coeff values should be 0, 
-    # and would otherwise cause boundary condition nan's to appear in the 
-    # cross-derivatives: infinity is changed into 0 later.
-
-    if self.BC_W == 'Periodic':
-      if self.BC_E == 'Periodic':
-        # For each side, there will be two new diagonals (mostly zeros), and 
-        # two sets of diagonals that will replace values in current diagonals.
-        # This is because of the pattern of fill in the periodic b.c.'s in the 
-        # x-direction.
-        
-        # First, create arrays for the new values.
-        # One of the two values here, that from the y -/+ 1, x +/- 1 (E/W)
-        # boundary condition, will be in the same location that will be 
-        # overwritten in the initiating grid by the next perioidic b.c. over
-        self.cj_1i1_Periodic_right = np.zeros(self.qs.shape)
-        self.cj_2i0_Periodic_right = np.zeros(self.qs.shape)
-        j = 0
-        self.cj_1i1_Periodic_right[:,j] = self.cj_1i_1[:,j]
-        self.cj_2i0_Periodic_right[:,j] = self.cj_2i0[:,j]
-        j = 1
-        self.cj_2i0_Periodic_right[:,j] = self.cj_2i0[:,j]
-        
-        # Then, replace existing values with what will be needed to make the
-        # periodic boundary condition work.
-        j = 0
-        # ORDER IS IMPORTANT HERE! Don't change first before it changes other.
-        # (We are shuffling down the line)
-        self.cj_1i1[:,j] = self.cj_1i0[:,j]
-        self.cj_1i0[:,j] = self.cj_1i_1[:,j]
-
-        # And then change remaning off-grid values to np.inf (i.e. those that 
-        # were not altered to a real value
-        # These will be the +/- 2's and the j_1i_1 and the j1i1
-        # These are the farthest-out pentadiagonals that can't be reached by 
-        # the tridiagonals, and the tridiagonals that are farther away on the 
-        # y (big grid) axis that can't be reached by the single diagonals 
-        # that are farthest out
-        # So 4 diagonals.
-        # But ci1j1 is taken care of on -1 end before being rolled forwards
-        # (i.e. clockwise, if we are reading from the top of the tread of a 
-        # tire)
-        j = 0
-        self.cj_2i0[:,j] += np.inf
-        self.cj_1i_1[:,j] += np.inf
-        j = 1
-        self.cj_2i0[:,j] += np.inf
+  def get_coeff_values_stress(self, Te):
+    """
+    (name, value) pairs of the in-plane stress terms to add to the
+    coefficients, -sigma_xx*Te*w_xx - sigma_yy*Te*w_yy - 2*sigma_xy*Te*w_xy
+    discretized with central differences (as in F1D); none if there are no
+    in-plane stresses
+    """
+    if not (self.sigma_xx or self.sigma_yy or self.sigma_xy):
+      return []
+    sxx = self.sigma_xx*Te/self.dx**2
+    syy = self.sigma_yy*Te/self.dy**2
+    sxy = self.sigma_xy*Te/(2.*self.dx*self.dy)
+    return [('cj_1i0', -sxx), ('cj1i0', -sxx),
+            ('cj0i_1', -syy), ('cj0i1', -syy),
+            ('cj0i0', 2*sxx + 2*syy),
+            ('cj_1i_1', -sxy), ('cj1i1', -sxy),
+            ('cj_1i1', sxy), ('cj1i_1', sxy)]
+
+  def get_coeff_values_vWC1994(self):
+    """
+    Coefficient values for a spatially variable Te from the van Wees and
+    Cloetingh (1994) solution, re-discretized using a central difference
+    approximation to 2nd order precision
+    """
+    # Divide once; multiply everywhere else
+    rdx4 = 1./self.dx4
+    rdy4 = 1./self.dy4
+    rdx2dy2 = 1./self.dx2dy2
+    nu = self.nu
 
-      else:
-        sys.exit("Not physical to have one wrap-around boundary but not its pair.")
-    elif self.BC_W == '0Displacement0Slope':
-      j = 0
-      self.cj_2i0[:,j] += np.inf
-      self.cj_1i_1[:,j] += np.inf
-      self.cj_1i0[:,j] += np.inf
-      self.cj_1i1[:,j] += np.inf
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0
-      self.cj0i0[:,j] += 0
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += 0
-      self.cj1i0[:,j] += 0
-      self.cj1i1[:,j] += 0
-      self.cj2i0[:,j] += 0
-      j = 1
-      self.cj_2i0[:,j] += np.inf
-      self.cj_1i_1[:,j] += 0
-      self.cj_1i0[:,j] += 0
-      self.cj_1i1[:,j] += 0
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0
-      self.cj0i0[:,j] += 0
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += 0
-      self.cj1i0[:,j] += 0
-      self.cj1i1[:,j] += 0
-      self.cj2i0[:,j] += 0
-    elif self.BC_W == '0Moment0Shear':
-      j = 0
-      self.cj_2i0[:,j] += np.inf
-      self.cj_1i_1[:,j] += np.inf
-      self.cj_1i0[:,j] += np.inf
-      self.cj_1i1[:,j] += np.inf
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 2*self.cj_1i_1_coeff_ij[:,j]
-      self.cj0i0[:,j] += 4*self.cj_2i0_coeff_ij[:,j] + 2*self.cj_1i0_coeff_ij[:,j]
-      self.cj0i1[:,j] += 2*self.cj_1i1_coeff_ij[:,j]
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += -self.cj_1i_1_coeff_ij[:,j]
-      self.cj1i0[:,j] += -4*self.cj_2i0_coeff_ij[:,j] - self.cj_1i0_coeff_ij[:,j]
-      self.cj1i1[:,j] += -self.cj_1i1_coeff_ij[:,j]
-      self.cj2i0[:,j] += self.cj_2i0_coeff_ij[:,j]
-      j = 1
-      self.cj_2i0[:,j] += np.inf
-      self.cj_1i_1[:,j] += 0
-      self.cj_1i0[:,j] += 2*self.cj_2i0_coeff_ij[:,j]
-      self.cj_1i1[:,j] += 0
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0
-      self.cj0i0[:,j] += 0
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += 0
-      self.cj1i0[:,j] += -2*self.cj_2i0_coeff_ij[:,j]
-      self.cj1i1[:,j] += 0
-      self.cj2i0[:,j] += self.cj_2i0_coeff_ij[:,j]
-    elif self.BC_W == '0Slope0Shear':
-      j = 0
-      self.cj_2i0[:,j] += np.inf
-      self.cj_1i_1[:,j] += np.inf
-      self.cj_1i0[:,j] += np.inf
-      self.cj_1i1[:,j] += np.inf
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0 
-      self.cj0i0[:,j] += 0
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += self.cj_1i_1_coeff_ij[:,j] 
-      self.cj1i0[:,j] += self.cj_1i0_coeff_ij[:,j]
-      self.cj1i1[:,j] += self.cj_1i1_coeff_ij[:,j] #Interference
-      self.cj2i0[:,j] += self.cj_2i0_coeff_ij[:,j]
-      j = 1
-      self.cj_2i0[:,j] += np.inf
-      self.cj_1i_1[:,j] += 0
-      self.cj_1i0[:,j] += 0
-      self.cj_1i1[:,j] += 0
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0
-      self.cj0i0[:,j] += 0
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += 0
-      self.cj1i0[:,j] += 0
-      self.cj1i1[:,j] += 0
-      self.cj2i0[:,j] += self.cj_2i0_coeff_ij[:,j]
-    elif self.BC_W == 'Mirror':
-      j = 0
-      self.cj_2i0[:,j] += np.inf
-      self.cj_1i_1[:,j] += np.inf
-      self.cj_1i0[:,j] += np.inf
-      self.cj_1i1[:,j] += np.inf
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0
-      self.cj0i0[:,j] += 0
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += self.cj_1i_1_coeff_ij[:,j] 
-      self.cj1i0[:,j] += self.cj_1i0_coeff_ij[:,j]
-      self.cj1i1[:,j] += self.cj_1i1_coeff_ij[:,j]
-      self.cj2i0[:,j] += self.cj_2i0_coeff_ij[:,j]
-      j = 1
-      self.cj_2i0[:,j] += np.inf
-      self.cj_1i_1[:,j] += 0
-      self.cj_1i0[:,j] += 0
-      self.cj_1i1[:,j] += 0
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0
-      self.cj0i0[:,j] += self.cj_2i0_coeff_ij[:,j]
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += 0
-      self.cj1i0[:,j] += 0
-      self.cj1i1[:,j] += 0
-      self.cj2i0[:,j] += 0
-    else:
-      # Possibly redundant safeguard
-      sys.exit("Invalid boundary condition")
+    # All derivatives here, to make reading the equations below easier
+    D = self.D
+    D00 = D[1:-1,1:-1]
+    D10 = D[1:-1,2:]
+    D_10 = D[1:-1,:-2]
+    D01 = D[2:,1:-1]
+    D0_1 = D[:-2,1:-1]
+    D11 = D[2:,2:]
+    D_11 = D[2:,:-2]
+    D1_1 = D[:-2,2:]
+    D_1_1 = D[:-2,:-2]
+    # Derivatives of D -- not including /(dx^a dy^b)
+    # Everything below is evaluated in place, into the output arrays or into
+    # a single scratch array, rather than through NumPy expressions that
+    # would each allocate (and traverse) several grid-sized temporaries
+    D0  = D00
+    # Dx = (-D_10 + D10)/2.
+    Dx = np.subtract(D10, D_10); Dx *= 0.5
+    # Dy = (-D0_1 + D01)/2.
+    Dy = np.subtract(D01, D0_1); Dy *= 0.5
+    # Dxx = (D_10 - 2.*D00 + D10)
+    Dxx = np.add(D_10, D10); Dxx -= D00; Dxx -= D00
+    # Dyy = (D0_1 - 2.*D00 + D01)
+    Dyy = np.add(D0_1, D01); Dyy -= D00; Dyy -= D00
+    # Dxy = (D_1_1 - D_11 - D1_1 + D11)/4.
+    Dxy = np.subtract(D_1_1, D_11); Dxy -= D1_1; Dxy += D11; Dxy *= 0.25
+
+    # Combinations of these that are shared between coefficients: compute
+    # each of them only once
+    # Dxy_nu = Dxy*(1-nu)/2.
+    Dxy_nu = Dxy; Dxy_nu *= (1-nu)/2. # Dxy itself is not needed again
+    # D0_Dx_m, D0_Dx_p = 2.*D0 -/+ Dx
+    D0_Dx_m = np.multiply(D0, 2.); D0_Dx_m -= Dx
+    D0_Dx_p = np.multiply(D0, 2.); D0_Dx_p += Dx
+    # Dy_Dxy_m, Dy_Dxy_p = Dy -/+ Dxy*(1-nu)/2.
+    Dy_Dxy_m = np.subtract(Dy, Dxy_nu)
+    Dy_Dxy_p = Dxy_nu; Dy_Dxy_p += Dy
+    # D0_4_Dx_m, D0_4_Dx_p = -4.*D0 +/- 2.*Dx; and the same for y
+    D0_4_Dx_m = np.multiply(Dx, 2.); D0_4_Dx_p = np.negative(D0_4_Dx_m)
+    D0_4_Dy_m = np.multiply(Dy, 2.); D0_4_Dy_p = np.negative(D0_4_Dy_m)
+    D0_4 = np.multiply(D0, -4.)
+    for D0_4_D in (D0_4_Dx_m, D0_4_Dx_p, D0_4_Dy_m, D0_4_Dy_p):
+      D0_4_D += D0_4
+    # nu*Dxx, nu*Dyy
+    nuDxx = np.multiply(Dxx, nu)
+    nuDyy = np.multiply(Dyy, nu)
+    tmp = D0_4 # Scratch space from here on
+
+    # NEW STENCIL
+    # x = -2, y = 0: (D0 - Dx) * rdx4
+    c = self.cj_2i0_coeff_ij = self._coeff_buffer('cj_2i0')
+    np.subtract(D0, Dx, out=c); c *= rdx4
+    # x = 0, y = -2: (D0 - Dy) * rdy4
+    c = self.cj0i_2_coeff_ij = self._coeff_buffer('cj0i_2')
+    np.subtract(D0, Dy, out=c); c *= rdy4
+    # x = 0, y = 2: (D0 + Dy) * rdy4
+    c = self.cj0i2_coeff_ij = self._coeff_buffer('cj0i2')
+    np.add(D0, Dy, out=c); c *= rdy4
+    # x = 2, y = 0: (D0 + Dx) * rdx4
+    c = self.cj2i0_coeff_ij = self._coeff_buffer('cj2i0')
+    np.add(D0, Dx, out=c); c *= rdx4
+    # x = -1, y = -1: (2.*D0 - Dx - Dy + Dxy*(1-nu)/2.) * rdx2dy2
+    c = self.cj_1i_1_coeff_ij = self._coeff_buffer('cj_1i_1')
+    np.subtract(D0_Dx_m, Dy_Dxy_m, out=c); c *= rdx2dy2
+    # x = -1, y = 1: (2.*D0 - Dx + Dy - Dxy*(1-nu)/2.) * rdx2dy2
+    c = self.cj_1i1_coeff_ij = self._coeff_buffer('cj_1i1')
+    np.add(D0_Dx_m, Dy_Dxy_m, out=c); c *= rdx2dy2
+    # x = 1, y = -1: (2.*D0 + Dx - Dy - Dxy*(1-nu)/2.) * rdx2dy2
+    c = self.cj1i_1_coeff_ij = self._coeff_buffer('cj1i_1')
+    np.subtract(D0_Dx_p, Dy_Dxy_p, out=c); c *= rdx2dy2
+    # x = 1, y = 1: (2.*D0 + Dx + Dy + Dxy*(1-nu)/2.) * rdx2dy2
+    c = self.cj1i1_coeff_ij = self._coeff_buffer('cj1i1')
+    np.add(D0_Dx_p, Dy_Dxy_p, out=c); c *= rdx2dy2
+    # x = -1, y = 0:
+    # (-4.*D0 + 2.*Dx + Dxx)*rdx4 + (-4.*D0 + 2.*Dx + nu*Dyy)*rdx2dy2
+    c = self.cj_1i0_coeff_ij = self._coeff_buffer('cj_1i0')
+    np.add(D0_4_Dx_m, Dxx, out=c); c *= rdx4
+    np.add(D0_4_Dx_m, nuDyy, out=tmp); tmp *= rdx2dy2; c += tmp
+    # x = 0, y = -1:
+    # (-4.*D0 + 2.*Dy + Dyy)*rdy4 + (-4.*D0 + 2.*Dy + nu*Dxx)*rdx2dy2
+    c = self.cj0i_1_coeff_ij = self._coeff_buffer('cj0i_1')
+    np.add(D0_4_Dy_m, Dyy, out=c); c *= rdy4
+    np.add(D0_4_Dy_m, nuDxx, out=tmp); tmp *= rdx2dy2; c += tmp
+    # x = 0, y = 1:
+    # (-4.*D0 - 2.*Dy + Dyy)*rdy4 + (-4.*D0 - 2.*Dy + nu*Dxx)*rdx2dy2
+    c = self.cj0i1_coeff_ij = self._coeff_buffer('cj0i1')
+    np.add(D0_4_Dy_p, Dyy, out=c); c *= rdy4
+    np.add(D0_4_Dy_p, nuDxx, out=tmp); tmp *= rdx2dy2; c += tmp
+    # x = 1, y = 0:
+    # (-4.*D0 - 2.*Dx + Dxx)*rdx4 + (-4.*D0 - 2.*Dx + nu*Dyy)*rdx2dy2
+    c = self.cj1i0_coeff_ij = self._coeff_buffer('cj1i0')
+    np.add(D0_4_Dx_p, Dxx, out=c); c *= rdx4
+    np.add(D0_4_Dx_p, nuDyy, out=tmp); tmp *= rdx2dy2; c += tmp
+    # x = 0, y = 0:
+    # (6.*D0 - 2.*Dxx)*rdx4 + (6.*D0 - 2.*Dyy)*rdy4
+    #   + (8.*D0 - 2.*nu*Dxx - 2.*nu*Dyy)*rdx2dy2 + drho*g
+    # = D0*(6.*rdx4 + 6.*rdy4 + 8.*rdx2dy2)
+    #   - Dxx*(2.*rdx4 + 2.*nu*rdx2dy2) - Dyy*(2.*rdy4 + 2.*nu*rdx2dy2) + drho*g
+    c = self.cj0i0_coeff_ij = self._coeff_buffer('cj0i0')
+    np.multiply(D0, 6.*rdx4 + 6.*rdy4 + 8.*rdx2dy2, out=c)
+    np.multiply(Dxx, 2.*rdx4 + 2.*nu*rdx2dy2, out=tmp); c -= tmp
+    np.multiply(Dyy, 2.*rdy4 + 2.*nu*rdx2dy2, out=tmp); c -= tmp
+    c += self.drho*self.g
+
+  def get_coeff_values_G2009(self):
+    """
+    Coefficient values for a spatially variable Te from the stencil of
+    Govers et al. (2009) -- first-order differences.
+    Note that this breaks down with b.c.'s that place too much control 
+    on the solution -- harmonic wavetrains
+    """
+    # Divide once; multiply everywhere else
+    rdx4 = 1./self.dx4
+    rdy4 = 1./self.dy4
+    rdx2dy2 = 1./self.dx2dy2
 
-    if self.BC_E == 'Periodic':
-      # See more extensive comments above (BC_W)
-      
-      if self.BC_W == 'Periodic':
-        # New arrays -- new diagonals, but mostly empty. Just corners of blocks
-        # (boxes) in block-diagonal matrix
-        self.cj1i_1_Periodic_left = np.zeros(self.qs.shape)
-        self.cj2i0_Periodic_left = np.zeros(self.qs.shape)
-        j = -1
-        self.cj1i_1_Periodic_left[:,j] = self.cj1i_1[:,j]
-        self.cj2i0_Periodic_left[:,j] = self.cj2i0[:,j]
-        j=-2
-        self.cj2i0_Periodic_left[:,j] = self.cj2i0[:,j]
-        
-        # Then, replace existing values with what will be needed to make the
-        # periodic boundary condition work.
-        j =-1
-        self.cj1i_1[:,j] = self.cj1i0[:,j]
-        self.cj1i0[:,j] = self.cj1i1[:,j]
-
-        # And then change remaning off-grid values to np.inf (i.e. those that 
-        # were not altered to a real value
-        j = -1
-        self.cj1i1[:,j] += np.inf
-        self.cj2i0[:,j] += np.inf
-        j = -2
-        self.cj2i0[:,j] += np.inf
+    # Only the neighboring values of D are needed here, not its derivatives
+    D = self.D
+    D00 = D[1:-1,1:-1]
+    D10 = D[1:-1,2:]
+    D_10 = D[1:-1,:-2]
+    D01 = D[2:,1:-1]
+    D0_1 = D[:-2,1:-1]
+
+    # Sums of neighboring values that are shared between coefficients
+    D0_1_00 = D0_1 + D00
+    D01_00 = D01 + D00
+    D10_00 = D10 + D00
+
+    # x is j and y is i b/c matrix row/column notation
+    # x = -2, y = 0
+    self.cj_2i0_coeff_ij = np.multiply(D_10, rdx4, out=self._coeff_buffer('cj_2i0'))
+    # x = -1, y = -1
+    self.cj_1i_1_coeff_ij = np.multiply(D_10 + D0_1, rdx2dy2, out=self._coeff_buffer('cj_1i_1'))
+    # x = -1, y = 0
+    self.cj_1i0_coeff_ij = np.multiply(-2., D0_1_00*rdx2dy2 + (D00 + D_10)*rdx4, out=self._coeff_buffer('cj_1i0'))
+    # x = -1, y = 1
+    self.cj_1i1_coeff_ij = np.multiply(D_10 + D01, rdx2dy2, out=self._coeff_buffer('cj_1i1'))
+    # x = 0, y = -2
+    self.cj0i_2_coeff_ij = np.multiply(D0_1, rdy4, out=self._coeff_buffer('cj0i_2'))
+    # x = 0, y = -1: -2. * ( (D0_1 + D00)*rdx2dy2 + (D00 + D0_1)*rdy4 )
+    self.cj0i_1_coeff_ij = np.multiply(D0_1_00, -2.*(rdx2dy2 + rdy4), out=self._coeff_buffer('cj0i_1'))
+    # x = 0, y = 0
+    self.cj0i0_coeff_ij = np.add((D10 + D_10)*rdx4 + (D01 + D0_1)*rdy4
+                                 + D00*(4.*rdx4 + 4.*rdy4 + 8.*rdx2dy2),
+                                 self.drho*self.g, out=self._coeff_buffer('cj0i0'))
+    # x = 0, y = 1: -2. * ( (D01 + D00)*rdy4 + (D00 + D01)*rdx2dy2 )
+    self.cj0i1_coeff_ij = np.multiply(D01_00, -2.*(rdy4 + rdx2dy2), out=self._coeff_buffer('cj0i1'))
+    # x = 0, y = 2
+    self.cj0i2_coeff_ij = np.multiply(D0_1, rdy4, out=self._coeff_buffer('cj0i2'))
+    # x = 1, y = -1
+    self.cj1i_1_coeff_ij = np.multiply(D10 + D0_1, rdx2dy2, out=self._coeff_buffer('cj1i_1'))
+    # x = 1, y = 0: -2. * ( (D10 + D00)*rdx4 + (D10 + D00)*rdx2dy2 )
+    self.cj1i0_coeff_ij = np.multiply(D10_00, -2.*(rdx4 + rdx2dy2), out=self._coeff_buffer('cj1i0'))
+    # x = 1, y = 1
+    self.cj1i1_coeff_ij = np.multiply(D10 + D01, rdx2dy2, out=self._coeff_buffer('cj1i1'))
+    # x = 2, y = 0
+    self.cj2i0_coeff_ij = np.multiply(D10, rdx4, out=self._coeff_buffer('cj2i0'))
+
+  def _coeff_buffer(self, name):
+    """
+    Array into which the "_coeff_ij" values for coefficient "name" are
+    written: the one from the last run, if it can be reused (none of the
+    arrays built from it are), so repeated runs do not allocate new ones
+    """
+    buf = getattr(self, name+'_coeff_ij', None)
+    if buf is None or buf.shape != self.qs.shape or not buf.flags.writeable:
+      buf = np.empty(self.qs.shape)
+    return buf
 
-      else:
-        sys.exit("Not physical to have one wrap-around boundary but not its pair.")
-
-    elif self.BC_E == '0Displacement0Slope':
-      j = -1
-      self.cj_2i0[:,j] += 0
-      self.cj_1i_1[:,j] += 0
-      self.cj_1i0[:,j] += 0
-      self.cj_1i1[:,j] += 0
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0
-      self.cj0i0[:,j] += 0
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += np.inf
-      self.cj1i0[:,j] += np.inf
-      self.cj1i1[:,j] += np.inf
-      self.cj2i0[:,j] += np.inf
-      j = -2
-      self.cj_2i0[:,j] += 0
-      self.cj_1i_1[:,j] += 0
-      self.cj_1i0[:,j] += 0
-      self.cj_1i1[:,j] += 0
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0
-      self.cj0i0[:,j] += 0
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += 0
-      self.cj1i0[:,j] += 0
-      self.cj1i1[:,j] += 0
-      self.cj2i0[:,j] += np.inf
-    elif self.BC_E == '0Moment0Shear':
-      j = -1
-      self.cj_2i0[:,j] += self.cj2i0_coeff_ij[:,j]
-      self.cj_1i_1[:,j] += -self.cj1i_1_coeff_ij[:,j]
-      self.cj_1i0[:,j] += -4*self.cj2i0_coeff_ij[:,j] - self.cj1i0_coeff_ij[:,j]
-      self.cj_1i1[:,j] += -self.cj1i1_coeff_ij[:,j]
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 2*self.cj1i_1_coeff_ij[:,j]
-      self.cj0i0[:,j] += 4*self.cj2i0_coeff_ij[:,j] + 2*self.cj1i0_coeff_ij[:,j]
-      self.cj0i1[:,j] += 2*self.cj1i1_coeff_ij[:,j]
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += np.inf
-      self.cj1i0[:,j] += np.inf
-      self.cj1i1[:,j] += np.inf
-      self.cj2i0[:,j] += np.inf
-      j = -2
-      self.cj_2i0[:,j] += self.cj2i0_coeff_ij[:,j]
-      self.cj_1i_1[:,j] += 0
-      self.cj_1i0[:,j] += -2*self.cj2i0_coeff_ij[:,j]
-      self.cj_1i1[:,j] += 0
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0
-      self.cj0i0[:,j] += 0
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += 0
-      self.cj1i0[:,j] += 2*self.cj2i0_coeff_ij[:,j]
-      self.cj1i1[:,j] += 0
-      self.cj2i0[:,j] += np.inf
-    elif self.BC_E == '0Slope0Shear':
-      j = -1
-      self.cj_2i0[:,j] += self.cj2i0_coeff_ij[:,j]
-      self.cj_1i_1[:,j] += self.cj1i_1_coeff_ij[:,j]
-      self.cj_1i0[:,j] += self.cj1i0_coeff_ij[:,j]
-      self.cj_1i1[:,j] += self.cj1i1_coeff_ij[:,j]
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0
-      self.cj0i0[:,j] += 0
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += np.inf
-      self.cj1i0[:,j] += np.inf
-      self.cj1i1[:,j] += np.inf
-      self.cj2i0[:,j] += np.inf
-      j = -2
-      self.cj_2i0[:,j] += self.cj2i0_coeff_ij[:,j]
-      self.cj_1i_1[:,j] += 0
-      self.cj_1i0[:,j] += 0
-      self.cj_1i1[:,j] += 0
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0
-      self.cj0i0[:,j] += 0
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += 0
-      self.cj1i0[:,j] += 0
-      self.cj1i1[:,j] += 0
-      self.cj2i0[:,j] += np.inf
-    elif self.BC_E == 'Mirror':
-      j = -1
-      self.cj_2i0[:,j] += self.cj2i0_coeff_ij[:,j]
-      self.cj_1i_1[:,j] += self.cj1i_1_coeff_ij[:,j]
-      self.cj_1i0[:,j] += self.cj1i0_coeff_ij[:,j]
-      self.cj_1i1[:,j] += self.cj1i1_coeff_ij[:,j]
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0
-      self.cj0i0[:,j] += 0
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += np.inf
-      self.cj1i0[:,j] += np.inf
-      self.cj1i1[:,j] += np.inf
-      self.cj2i0[:,j] += np.inf
-      j = -2
-      self.cj_2i0[:,j] += 0
-      self.cj_1i_1[:,j] += 0
-      self.cj_1i0[:,j] += 0
-      self.cj_1i1[:,j] += 0
-      self.cj0i_2[:,j] += 0
-      self.cj0i_1[:,j] += 0
-      self.cj0i0[:,j] += self.cj2i0_coeff_ij[:,j]
-      self.cj0i1[:,j] += 0
-      self.cj0i2[:,j] += 0
-      self.cj1i_1[:,j] += 0
-      self.cj1i0[:,j] += 0
-      self.cj1i1[:,j] += 0
-      self.cj2i0[:,j] += np.inf
-    else:
-      # Possibly redundant safeguard
-      sys.exit("Invalid boundary condition")
+  def _scratch(self, name, value):
+    """
+    Array of the grid's shape filled with "value" (a scalar or
+    an array): the one used for "name" in the last run if it is still the
+    right size, so repeated runs do not allocate new ones
+    """
+    buf = self._scratch_buffers.get(name)
+    if buf is None or buf.shape != self.qs.shape:
+      buf = self._scratch_buffers[name] = np.empty(self.qs.shape)
+    buf[...] = value
+    return buf
 
-    #######################################################################
-    # DEFINE COEFFICIENTS TO W_i-2 -- W_i+2 WITH B.C.'S APPLIED (y: N, S) #
-    #######################################################################
-   
-    if self.BC_N == 'Periodic':
-      if self.BC_S == 'Periodic':
-        pass # Will address the N-S (whole-matrix-involving) boundary condition 
-             # inclusion below, when constructing sparse matrix diagonals
-      else:
-        sys.exit("Not physical to have one wrap-around boundary but not its pair.")
-    elif self.BC_N == '0Displacement0Slope':
-      i = 0
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:][self.cj_1i_1[i,:] != np.inf] = np.nan
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:] += 0
-      self.cj0i_2[i,:] += 0 #np.nan
-      self.cj0i_1[i,:] += 0 #np.nan
-      self.cj0i0[i,:] += 0
-      self.cj0i1[i,:] += 0
-      self.cj0i2[i,:] += 0
-      self.cj1i_1[i,:][self.cj1i_1[i,:] != np.inf] += 0 #np.nan
-      self.cj1i0[i,:] += 0
-      self.cj1i1[i,:] += 0
-      self.cj2i0[i,:] += 0
-      i = 1
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:] += 0
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:] += 0
-      self.cj0i_2[i,:] += 0 #np.nan
-      self.cj0i_1[i,:] += 0
-      self.cj0i0[i,:] += 0
-      self.cj0i1[i,:] += 0
-      self.cj0i2[i,:] += 0
-      self.cj1i_1[i,:] += 0
-      self.cj1i0[i,:] += 0
-      self.cj1i1[i,:] += 0
-      self.cj2i0[i,:] += 0
-    elif self.BC_N == '0Moment0Shear':
-      i = 0
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:][self.cj_1i_1[i,:] != np.inf] = np.nan
-      self.cj_1i0[i,:] += 2*self.cj_1i_1_coeff_ij[i,:]
-      self.cj_1i1[i,:] += -self.cj_1i_1_coeff_ij[i,:]
-      self.cj0i_2[i,:] += 0 #np.nan
-      self.cj0i_1[i,:] += 0 #np.nan
-      self.cj0i0[i,:] += 4*self.cj0i_2_coeff_ij[i,:] + 2*self.cj0i_1_coeff_ij[i,:]
-      self.cj0i1[i,:] += -4*self.cj0i_2_coeff_ij[i,:] - self.cj0i_1_coeff_ij[i,:]
-      self.cj0i2[i,:] += self.cj0i_2_coeff_ij[i,:]
-      self.cj1i_1[i,:][self.cj1i_1[i,:] != np.inf] += 0 #np.nan
-      self.cj1i0[i,:] += 2*self.cj1i_1_coeff_ij[i,:]
-      self.cj1i1[i,:] += -self.cj1i_1_coeff_ij[i,:]
-      self.cj2i0[i,:] += 0
-      i = 1
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:] += 0
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:] += 0
-      self.cj0i_2[i,:] += 0 #np.nan
-      self.cj0i_1[i,:] += 2*self.cj0i_2_coeff_ij[i,:]
-      self.cj0i0[i,:] += 0
-      self.cj0i1[i,:] += -2*self.cj0i_2_coeff_ij[i,:]
-      self.cj0i2[i,:] += self.cj0i_2_coeff_ij[i,:]
-      self.cj1i_1[i,:] += 0
-      self.cj1i0[i,:] += 0
-      self.cj1i1[i,:] += 0
-      self.cj2i0[i,:] += 0
-    elif self.BC_N == '0Slope0Shear':
-      i = 0
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:][self.cj_1i_1[i,:] != np.inf] = np.nan
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:] += self.cj_1i_1_coeff_ij[i,:]
-      self.cj0i_2[i,:] += 0 #np.nan
-      self.cj0i_1[i,:] += 0 #np.nan
-      self.cj0i0[i,:] += 0
-      self.cj0i1[i,:] += self.cj0i_1_coeff_ij[i,:]
-      self.cj0i2[i,:] += self.cj0i_2_coeff_ij[i,:]
-      self.cj1i_1[i,:][self.cj1i_1[i,:] != np.inf] += 0 #np.nan
-      self.cj1i0[i,:] += 0
-      self.cj1i1[i,:] += self.cj1i_1_coeff_ij[i,:]
-      self.cj2i0[i,:] += 0
-      i = 1
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:] += 0
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:] += 0
-      self.cj0i_2[i,:] += 0 #np.nan
-      self.cj0i_1[i,:] += 0
-      self.cj0i0[i,:] += 0
-      self.cj0i1[i,:] += 0
-      self.cj0i2[i,:] += self.cj0i_2_coeff_ij[i,:]
-      self.cj1i_1[i,:] += 0
-      self.cj1i0[i,:] += 0
-      self.cj1i1[i,:] += 0
-      self.cj2i0[i,:] += 0
-    elif self.BC_N == 'Mirror':
-      i = 0
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:][self.cj_1i_1[i,:] != np.inf] = np.nan
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:] += self.cj_1i_1_coeff_ij[i,:]
-      self.cj0i_2[i,:] += 0 #np.nan
-      self.cj0i_1[i,:] += 0 #np.nan
-      self.cj0i0[i,:] += 0
-      self.cj0i1[i,:] += self.cj0i_1_coeff_ij[i,:]
-      self.cj0i2[i,:] += self.cj0i_2_coeff_ij[i,:]
-      self.cj1i_1[i,:][self.cj1i_1[i,:] != np.inf] += 0 #np.nan
-      self.cj1i0[i,:] += 0
-      self.cj1i1[i,:] += self.cj1i_1_coeff_ij[i,:]
-      self.cj2i0[i,:] += 0
-      i = 1
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:] += 0
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:] += 0
-      self.cj0i_2[i,:] += 0 #np.nan
-      self.cj0i_1[i,:] += 0
-      self.cj0i0[i,:] += self.cj0i_2_coeff_ij[i,:]
-      self.cj0i1[i,:] += 0
-      self.cj0i2[i,:] += 0
-      self.cj1i_1[i,:] += 0
-      self.cj1i0[i,:] += 0
-      self.cj1i1[i,:] += 0
-      self.cj2i0[i,:] += 0
-    else:
-      # Possibly redundant safeguard
-      sys.exit("Invalid boundary condition")
+  def _cow(self, *names):
+    """
+    Copy-on-write for the coefficient arrays that start out as the same
+    arrays as their "_coeff_ij" counterparts: those must keep their original
+    values while the boundary conditions are applied, so copy each array
+    before it is first modified
+    """
+    for name in names:
+      cj_ij = getattr(self, name+'_coeff_ij')
+      if getattr(self, name) is cj_ij:
+        setattr(self, name, self._scratch(name, cj_ij))
 
-    if self.BC_S == 'Periodic':
-      if self.BC_N == 'Periodic':
-        pass # Will address the N-S (whole-matrix-involving) boundary condition 
-             # inclusion below, when constructing sparse matrix diagonals
-      else:
-        sys.exit("Not physical to have one wrap-around boundary but not its pair.")
-    elif self.BC_S == '0Displacement0Slope':
-      i = -2
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:] += 0
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:] += 0
-      self.cj0i_2[i,:] += 0
-      self.cj0i_1[i,:] += 0
-      self.cj0i0[i,:] += 0
-      self.cj0i1[i,:] += 0
-      self.cj0i2[i,:] += 0 #np.nan
-      self.cj1i1[i,:] += 0
-      self.cj1i0[i,:] += 0
-      self.cj1i_1[i,:] += 0
-      self.cj2i0[i,:] += 0
-      i = -1
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:] += 0
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:][self.cj_1i1[i,:] != np.inf] += 0 #np.nan
-      self.cj0i_2[i,:] += 0
-      self.cj0i_1[i,:] += 0
-      self.cj0i0[i,:] += 0
-      self.cj0i1[i,:] += 0 #np.nan
-      self.cj0i2[i,:] += 0 #np.nan
-      self.cj1i_1[i,:] += 0
-      self.cj1i0[i,:] += 0
-      self.cj1i1[i,:][self.cj1i1[i,:] != np.inf] += 0 #np.nan
-      self.cj2i0[i,:] += 0
-    elif self.BC_S == '0Moment0Shear':
-      i = -2
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:] += 0
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:] += 0
-      self.cj0i_2[i,:] += self.cj0i2_coeff_ij[i,:]
-      self.cj0i_1[i,:] += -2*self.cj0i2_coeff_ij[i,:]
-      self.cj0i0[i,:] += 0
-      self.cj0i1[i,:] += 2*self.cj0i2_coeff_ij[i,:]
-      self.cj0i2[i,:] += 0 #np.nan
-      self.cj1i1[i,:] += 0
-      self.cj1i0[i,:] += 0
-      self.cj1i_1[i,:] += 0
-      self.cj2i0[i,:] += 0
-      i = -1
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:] += -self.cj1i1_coeff_ij[i,:]
-      self.cj_1i0[i,:] += 2*self.cj1i1_coeff_ij[i,:]
-      self.cj_1i1[i,:][self.cj_1i1[i,:] != np.inf] += 0 #np.nan
-      self.cj0i_2[i,:] += self.cj0i2_coeff_ij[i,:]
-      self.cj0i_1[i,:] += -4*self.cj0i2_coeff_ij[i,:] - self.cj0i1_coeff_ij[i,:]
-      self.cj0i0[i,:] += 4*self.cj0i2_coeff_ij[i,:] + 2*self.cj0i1_coeff_ij[i,:]
-      self.cj0i1[i,:] += 0 #np.nan
-      self.cj0i2[i,:] += 0 #np.nan
-      self.cj1i_1[i,:] += -self.cj_1i1_coeff_ij[i,:]
-      self.cj1i0[i,:] += 2*self.cj_1i1_coeff_ij[i,:]
-      self.cj1i1[i,:][self.cj1i1[i,:] != np.inf] += 0 #np.nan
-      self.cj2i0[i,:] += 0
-    elif self.BC_S == '0Slope0Shear':
-      i = -2
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:] += 0
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:] += 0
-      self.cj0i_2[i,:] += self.cj0i2_coeff_ij[i,:]
-      self.cj0i_1[i,:] += 0
-      self.cj0i0[i,:] += 0
-      self.cj0i1[i,:] += 0
-      self.cj0i2[i,:] += 0 #np.nan
-      self.cj1i_1[i,:] += 0
-      self.cj1i0[i,:] += 0
-      self.cj1i1[i,:] += 0
-      self.cj2i0[i,:] += 0
-      i = -1
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:] += self.cj_1i1_coeff_ij[i,:]
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:][self.cj_1i1[i,:] != np.inf] += 0 #np.nan
-      self.cj0i_2[i,:] += self.cj0i2_coeff_ij[i,:]
-      self.cj0i_1[i,:] += self.cj0i1_coeff_ij[i,:]
-      self.cj0i0[i,:] += 0
-      self.cj0i1[i,:] += 0 #np.nan
-      self.cj0i2[i,:] += 0 #np.nan
-      self.cj1i_1[i,:] += self.cj1i1_coeff_ij[i,:]
-      self.cj1i0[i,:] += 0
-      self.cj1i1[i,:][self.cj1i1[i,:] != np.inf] += 0 #np.nan
-      self.cj2i0[i,:] += 0
-    elif self.BC_S == 'Mirror':
-      i = -2
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:] += 0
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:] += 0
-      self.cj0i_2[i,:] += 0
-      self.cj0i_1[i,:] += 0
-      self.cj0i0[i,:] += self.cj0i2_coeff_ij[i,:]
-      self.cj0i1[i,:] += 0
-      self.cj0i2[i,:] += 0 #np.nan
-      self.cj1i_1[i,:] += 0
-      self.cj1i0[i,:] += 0
-      self.cj1i1[i,:] += 0
-      self.cj2i0[i,:] += 0
-      i = -1
-      self.cj_2i0[i,:] += 0
-      self.cj_1i_1[i,:] += self.cj_1i1_coeff_ij[i,:]
-      self.cj_1i0[i,:] += 0
-      self.cj_1i1[i,:][self.cj_1i1[i,:] != np.inf] += 0 #np.nan
-      self.cj0i_2[i,:] += self.cj0i2_coeff_ij[i,:]
-      self.cj0i_1[i,:] += self.cj0i1_coeff_ij[i,:]
-      self.cj0i0[i,:] += 0
-      self.cj0i1[i,:] += 0 #np.nan
-      self.cj0i2[i,:] += 0 #np.nan
-      self.cj1i_1[i,:] += self.cj1i1_coeff_ij[i,:]
-      self.cj1i0[i,:] += 0
-      self.cj1i1[i,:][self.cj1i1[i,:] != np.inf] += 0 #np.nan
-      self.cj2i0[i,:] += 0
-    else:
-      # Possibly redundant safeguard
-      sys.exit("Invalid boundary condition")
+  def BC_Flexure(self):
 
-    #####################################################
-    # CORNERS: INTERFERENCE BETWEEN BOUNDARY CONDITIONS #
-    #####################################################
-    
-    # In 2D, have to consider diagonals and interference (additive) among 
-    # boundary conditions
+    # As in the 1D case, this is split over several functions: one for each
+    # boundary condition on each side, and one for the corners.
     
-    ############################
-    # DIRICHLET -- DO NOTHING. #
-    ############################
+    # Coefficients that would reach off of the grid are flagged in
+    # self._offgrid as (array name, index) pairs, and are set to 0 only
+    # after all of the boundary conditions have been applied. E-W ones will
+    # be internal to the matrix; N-S ones will spill off of its ends
+    # (C order, in rows), so it does not matter what they hold.
+    self._offgrid = []
+
+    # Each boundary condition changes only the two columns (W, E) or rows
+    # (N, S) nearest to its side of the grid. Periodic ones are applied by
+    # their own functions, and the rest from a table, as laid out for this
+    # combination of boundary conditions by BC_Flexure_plan
+    for step in self.BC_Flexure_plan():
+      if callable(step):
+        step(self)
+        continue
+      cow, offgrid, terms = step
+      self._cow(*cow)
+      self._offgrid.extend(offgrid)
+      for name, index, name_ij, multiple in terms:
+        cj = getattr(self, name)[index]
+        cj_ij = getattr(self, name_ij+'_coeff_ij')[index]
+        if multiple == 1:
+          cj += cj_ij
+        elif multiple == -1:
+          cj -= cj_ij
+        else:
+          cj += multiple*cj_ij
+
+    self.BC_Flexure_corners()
+
+    # The off-grid coefficients may have had cross-derivative terms from the
+    # other boundaries added into them since they were flagged: zero them now
+    for name, index in self._offgrid:
+      self._cow(name)
+      getattr(self, name)[index] = 0
+
+  #######################################################################
+  # DEFINE COEFFICIENTS TO W_j-2 -- W_j+2 WITH B.C.'S APPLIED (x: W, E) #
+  #######################################################################
+  
+  # self._offgrid is used to flag places where coeff values should be 0, 
+  # and would otherwise pick up values from the cross-derivatives: these 
+  # are changed into 0 at the end of BC_Flexure.
+
+  def BC_Flexure_W_Periodic(self):
+    self._cow('cj_1i1', 'cj_1i0')
+    # For each side, there will be two new diagonals (mostly zeros), and 
+    # two sets of diagonals that will replace values in current diagonals.
+    # This is because of the pattern of fill in the periodic b.c.'s in the 
+    # x-direction.
     
-    # Do nothing.
-    # What about combinations?
-    # This will mean that dirichlet boundary conditions will implicitly
-    # control the corners, so, for examplel, they would be locked all of the
-    # way to the edge of the domain instead of becoming free to deflect at the 
-    # ends.
-    # Indeed it is much easier to envision this case than one in which 
-    # the stationary clamp is released.
+    # First, create arrays for the new values.
+    # One of the two values here, that from the y -/+ 1, x +/- 1 (E/W)
+    # boundary condition, will be in the same location that will be 
+    # overwritten in the initiating grid by the next perioidic b.c. over
+    self.cj_1i1_Periodic_right = self._scratch('cj_1i1_Periodic_right', 0)
+    self.cj_2i0_Periodic_right = self._scratch('cj_2i0_Periodic_right', 0)
+    j = 0
+    self.cj_1i1_Periodic_right[:,j] = self.cj_1i_1[:,j]
+    self.cj_2i0_Periodic_right[:,j] = self.cj_2i0[:,j]
+    j = 1
+    self.cj_2i0_Periodic_right[:,j] = self.cj_2i0[:,j]
     
-    #################
-    # 0MOMENT0SHEAR #
-    #################
-    if self.BC_N == '0Moment0Shear' and self.BC_W == '0Moment0Shear':
-      self.cj0i0[0,0] += 2*self.cj_1i_1_coeff_ij[0,0]
-      self.cj1i1[0,0] -= self.cj_1i_1_coeff_ij[0,0]
-    if self.BC_N == '0Moment0Shear' and self.BC_E == '0Moment0Shear':
-      self.cj0i0[0,-1] += 2*self.cj_1i_1_coeff_ij[0,-1]
-      self.cj_1i1[0,-1] -= self.cj1i_1_coeff_ij[0,-1]
-    if self.BC_S == '0Moment0Shear' and self.BC_W == '0Moment0Shear':
-      self.cj0i0[-1,0] += 2*self.cj_1i_1_coeff_ij[-1,0]
-      self.cj1i_1[-1,0] -= self.cj_1i1_coeff_ij[-1,0]
-    if self.BC_S == '0Moment0Shear' and self.BC_E == '0Moment0Shear':
-      self.cj0i0[-1,-1] += 2*self.cj_1i_1_coeff_ij[-1,-1]
-      self.cj_1i_1[-1,-1] -= self.cj1i1_coeff_ij[-1,-1]
-
-    ############
-    # PERIODIC #
-    ############
+    # Then, replace existing values with what will be needed to make the
+    # periodic boundary condition work.
+    j = 0
+    # ORDER IS IMPORTANT HERE! Don't change first before it changes other.
+    # (We are shuffling down the line)
+    self.cj_1i1[:,j] = self.cj_1i0[:,j]
+    self.cj_1i0[:,j] = self.cj_1i_1[:,j]
+
+    # And then flag remaning off-grid values to be set to 0 (i.e. those that 
+    # were not altered to a real value
+    # These will be the +/- 2's and the j_1i_1 and the j1i1
+    # These are the farthest-out pentadiagonals that can't be reached by 
+    # the tridiagonals, and the tridiagonals that are farther away on the 
+    # y (big grid) axis that can't be reached by the single diagonals 
+    # that are farthest out
+    # So 4 diagonals.
+    # But ci1j1 is taken care of on -1 end before being rolled forwards
+    # (i.e. clockwise, if we are reading from the top of the tread of a 
+    # tire)
+    j = 0
+    self._offgrid.append(('cj_2i0', np.s_[:,j]))
+    self._offgrid.append(('cj_1i_1', np.s_[:,j]))
+    j = 1
+    self._offgrid.append(('cj_2i0', np.s_[:,j]))
+
+  def BC_Flexure_E_Periodic(self):
+    # See more extensive comments above (BC_W)
     
-    # I think that nothing will be needed here.
-    # Periodic should just take care of all repeating in all directions by
-    # its very nature. (I.e. it is embedded in the sparse array structure
-    # of diagonals)
-
-
-    ################
-    # COMBINATIONS #
-    ################
+    self._cow('cj1i_1', 'cj1i0')
+    # New arrays -- new diagonals, but mostly empty. Just corners of blocks
+    # (boxes) in block-diagonal matrix
+    self.cj1i_1_Periodic_left = self._scratch('cj1i_1_Periodic_left', 0)
+    self.cj2i0_Periodic_left = self._scratch('cj2i0_Periodic_left', 0)
+    j = -1
+    self.cj1i_1_Periodic_left[:,j] = self.cj1i_1[:,j]
+    self.cj2i0_Periodic_left[:,j] = self.cj2i0[:,j]
+    j=-2
+    self.cj2i0_Periodic_left[:,j] = self.cj2i0[:,j]
     
-    ##############################
-    # 0SLOPE0SHEAR AND/OR MIRROR #
-    ##############################
+    # Then, replace existing values with what will be needed to make the
+    # periodic boundary condition work.
+    j =-1
+    self.cj1i_1[:,j] = self.cj1i0[:,j]
+    self.cj1i0[:,j] = self.cj1i1[:,j]
+
+    # And then flag remaning off-grid values to be set to 0 (i.e. those that 
+    # were not altered to a real value
+    j = -1
+    self._offgrid.append(('cj1i1', np.s_[:,j]))
+    self._offgrid.append(('cj2i0', np.s_[:,j]))
+    j = -2
+    self._offgrid.append(('cj2i0', np.s_[:,j]))
+
+  #######################################################################
+  # DEFINE COEFFICIENTS TO W_i-2 -- W_i+2 WITH B.C.'S APPLIED (y: N, S) #
+  #######################################################################
+
+  def BC_Flexure_N_Periodic(self):
+    pass # Will address the N-S (whole-matrix-involving) boundary condition 
+         # inclusion below, when constructing sparse matrix diagonals
+
+  def BC_Flexure_S_Periodic(self):
+    pass # Will address the N-S (whole-matrix-involving) boundary condition 
+         # inclusion below, when constructing sparse matrix diagonals
+
+  #####################################################
+  # CORNERS: INTERFERENCE BETWEEN BOUNDARY CONDITIONS #
+  #####################################################
+
+  # In 2D, have to consider diagonals and interference (additive) among 
+  # boundary conditions
+
+  # Corners of the grid, as (row, column, N-S side, E-W side)
+  _corners = ((0, 0, 'N', 'W'), (0, -1, 'N', 'E'),
+              (-1, 0, 'S', 'W'), (-1, -1, 'S', 'E'))
+
+  # Rule for a corner, by the boundary conditions on its (N-S, E-W) sides.
+  #
+  # DIRICHLET -- DO NOTHING.
+  # What about combinations?
+  # This will mean that dirichlet boundary conditions will implicitly
+  # control the corners, so, for examplel, they would be locked all of the
+  # way to the edge of the domain instead of becoming free to deflect at the 
+  # ends.
+  # Indeed it is much easier to envision this case than one in which 
+  # the stationary clamp is released.
+  #
+  # PERIODIC B.C.'S AND OTHERS
+  # The Periodic boundary natively continues the other boundary conditions
+  # Nothing to be done here.
+  #
+  # So neither of these has a rule.
+  _BC_Flexure_corner_rules = {
+    ('0Moment0Shear', '0Moment0Shear'): '0Moment0Shear',
+    # 0SLOPE0SHEAR AND/OR MIRROR
     # (both end up being the same)
-    if (self.BC_N == '0Slope0Shear' or self.BC_N == 'Mirror') \
-      and (self.BC_W == '0Slope0Shear' or self.BC_W == 'Mirror'):
-      self.cj1i1[0,0] += self.cj_1i_1_coeff_ij[0,0]
-    if (self.BC_N == '0Slope0Shear' or self.BC_N == 'Mirror') \
-      and (self.BC_E == '0Slope0Shear' or self.BC_E == 'Mirror'):
-      self.cj_1i1[0,-1] += self.cj1i_1_coeff_ij[0,-1]
-    if (self.BC_S == '0Slope0Shear' or self.BC_S == 'Mirror') \
-      and (self.BC_W == '0Slope0Shear' or self.BC_W == 'Mirror'):
-      self.cj1i_1[-1,0] += self.cj_1i1_coeff_ij[-1,0]
-    if (self.BC_S == '0Slope0Shear' or self.BC_S == 'Mirror') \
-      and (self.BC_E == '0Slope0Shear' or self.BC_E == 'Mirror'):
-      self.cj_1i_1[-1,-1] += self.cj1i1_coeff_ij[-1,-1]
-
-    ################################
-    # 0MOMENT0SHEAR - AND - MIRROR #
-    ################################
+    ('0Slope0Shear', '0Slope0Shear'): '0Slope0Shear/Mirror',
+    ('0Slope0Shear', 'Mirror'): '0Slope0Shear/Mirror',
+    ('Mirror', '0Slope0Shear'): '0Slope0Shear/Mirror',
+    ('Mirror', 'Mirror'): '0Slope0Shear/Mirror',
+    # 0MOMENT0SHEAR - AND - MIRROR
     # How do multiple types of b.c.'s interfere
     # 0Moment0Shear must determine corner conditions in order to be mirrored
     # by the "mirror" b.c.
-    if (self.BC_N == 'Mirror' and self.BC_W == '0Moment0Shear') \
-      or (self.BC_W == 'Mirror' and self.BC_N == '0Moment0Shear'):
-      self.cj0i0[0,0] += 2*self.cj_1i_1_coeff_ij[0,0]
-      self.cj1i1[0,0] -= self.cj_1i_1_coeff_ij[0,0]
-    if (self.BC_N == 'Mirror' and self.BC_E == '0Moment0Shear') \
-      or (self.BC_E == 'Mirror' and self.BC_N == '0Moment0Shear'):
-      self.cj0i0[0,-1] += 2*self.cj_1i_1_coeff_ij[0,-1]
-      self.cj1i1[0,-1] -= self.cj_1i_1_coeff_ij[0,-1]
-    if (self.BC_S == 'Mirror' and self.BC_W == '0Moment0Shear') \
-      or (self.BC_W == 'Mirror' and self.BC_S == '0Moment0Shear'):
-      self.cj0i0[-1,0] += 2*self.cj_1i_1_coeff_ij[-1,0]
-      self.cj1i_1[-1,0] -= self.cj_1i1_coeff_ij[-1,0]
-    if (self.BC_S == 'Mirror' and self.BC_E == '0Moment0Shear') \
-      or (self.BC_E == 'Mirror' and self.BC_S == '0Moment0Shear'):
-      self.cj0i0[-1,-1] += 2*self.cj_1i_1_coeff_ij[-1,-1]
-      self.cj_1i_1[-1,-1] -= self.cj1i1_coeff_ij[-1,-1]
-
-    ######################################
-    # 0MOMENT0SHEAR - AND - 0SLOPE0SHEAR #
-    ######################################
+    ('Mirror', '0Moment0Shear'): '0Moment0Shear/other',
+    ('0Moment0Shear', 'Mirror'): '0Moment0Shear/other',
+    # 0MOMENT0SHEAR - AND - 0SLOPE0SHEAR
     # Just use 0Moment0Shear-style b.c.'s at corners: letting this dominate
     # because it seems to be the more geologically likely b.c.
-    if (self.BC_N == '0Slope0Shear' and self.BC_W == '0Moment0Shear') \
-      or (self.BC_W == '0Slope0Shear' and self.BC_N == '0Moment0Shear'):
-      self.cj0i0[0,0] += 2*self.cj_1i_1_coeff_ij[0,0]
-      self.cj1i1[0,0] -= self.cj_1i_1_coeff_ij[0,0]
-    if (self.BC_N == '0Slope0Shear' and self.BC_E == '0Moment0Shear') \
-      or (self.BC_E == '0Slope0Shear' and self.BC_N == '0Moment0Shear'):
-      self.cj0i0[0,-1] += 2*self.cj_1i_1_coeff_ij[0,-1]
-      self.cj1i1[0,-1] -= self.cj_1i_1_coeff_ij[0,-1]
-    if (self.BC_S == '0Slope0Shear' and self.BC_W == '0Moment0Shear') \
-      or (self.BC_W == '0Slope0Shear' and self.BC_S == '0Moment0Shear'):
-      self.cj0i0[-1,0] += 2*self.cj_1i_1_coeff_ij[-1,0]
-      self.cj1i_1[-1,0] -= self.cj_1i1_coeff_ij[-1,0]
-    if (self.BC_S == '0Slope0Shear' and self.BC_E == '0Moment0Shear') \
-      or (self.BC_E == '0Slope0Shear' and self.BC_S == '0Moment0Shear'):
-      self.cj0i0[-1,-1] += 2*self.cj_1i_1_coeff_ij[-1,-1]
-      self.cj_1i_1[-1,-1] -= self.cj1i1_coeff_ij[-1,-1]
+    ('0Slope0Shear', '0Moment0Shear'): '0Moment0Shear/other',
+    ('0Moment0Shear', '0Slope0Shear'): '0Moment0Shear/other',
+  }
+
+  # Terms added at each corner for each rule, as
+  # (coefficient array, "_coeff_ij" array it is taken from, multiple)
+  _BC_Flexure_corner_table = {
+    # 0MOMENT0SHEAR
+    ('NW', '0Moment0Shear'): (('cj0i0', 'cj_1i_1', 2), ('cj1i1', 'cj_1i_1', -1)),
+    ('NE', '0Moment0Shear'): (('cj0i0', 'cj_1i_1', 2), ('cj_1i1', 'cj1i_1', -1)),
+    ('SW', '0Moment0Shear'): (('cj0i0', 'cj_1i_1', 2), ('cj1i_1', 'cj_1i1', -1)),
+    ('SE', '0Moment0Shear'): (('cj0i0', 'cj_1i_1', 2), ('cj_1i_1', 'cj1i1', -1)),
+    # 0SLOPE0SHEAR AND/OR MIRROR
+    ('NW', '0Slope0Shear/Mirror'): (('cj1i1', 'cj_1i_1', 1),),
+    ('NE', '0Slope0Shear/Mirror'): (('cj_1i1', 'cj1i_1', 1),),
+    ('SW', '0Slope0Shear/Mirror'): (('cj1i_1', 'cj_1i1', 1),),
+    ('SE', '0Slope0Shear/Mirror'): (('cj_1i_1', 'cj1i1', 1),),
+    # 0MOMENT0SHEAR - AND - MIRROR OR 0SLOPE0SHEAR
+    # (as 0Moment0Shear, except at the NE corner)
+    ('NW', '0Moment0Shear/other'): (('cj0i0', 'cj_1i_1', 2), ('cj1i1', 'cj_1i_1', -1)),
+    ('NE', '0Moment0Shear/other'): (('cj0i0', 'cj_1i_1', 2), ('cj1i1', 'cj_1i_1', -1)),
+    ('SW', '0Moment0Shear/other'): (('cj0i0', 'cj_1i_1', 2), ('cj1i_1', 'cj_1i1', -1)),
+    ('SE', '0Moment0Shear/other'): (('cj0i0', 'cj_1i_1', 2), ('cj_1i_1', 'cj1i1', -1)),
     # What about 0Moment0SHear on N/S part?
+  }
 
-    ##############################
-    # PERIODIC B.C.'S AND OTHERS #
-    ##############################
-
-    # The Periodic boundary natively continues the other boundary conditions
-    # Nothing to be done here.
+  def BC_Flexure_corner_terms(self):
+    """
+    Terms added to the coefficient arrays at the corners of the grid, as
+    (array, row, column, "_coeff_ij" array, multiple), from the rule for the
+    boundary conditions that meet at each corner
+    """
+    terms = []
+    for i, j, side_NS, side_EW in self._corners:
+      rule = self._BC_Flexure_corner_rules.get((getattr(self, 'BC_'+side_NS),
+                                                getattr(self, 'BC_'+side_EW)))
+      if rule is None:
+        continue
+      for name, name_ij, multiple in self._BC_Flexure_corner_table[side_NS+side_EW, rule]:
+        terms.append((name, i, j, name_ij, multiple))
+    return terms
+
+  # Corner terms, by (BC_W, BC_E, BC_N, BC_S), grouped for BC_Flexure_corners
+  _BC_Flexure_corner_plans = {}
+
+  def BC_Flexure_corners(self):
+    """
+    Adds the corner terms from BC_Flexure_corner_terms. These are gathered
+    once for each combination of boundary conditions, and grouped by the
+    pair of arrays that they go between, so that each group is applied to all
+    of its corners with a single fancy-indexed update
+    """
+    key = (self.BC_W, self.BC_E, self.BC_N, self.BC_S)
+    try:
+      plan = self._BC_Flexure_corner_plans[key]
+    except KeyError:
+      groups = {}
+      for name, i, j, name_ij, multiple in self.BC_Flexure_corner_terms():
+        groups.setdefault((name, name_ij), []).append((i, j, multiple))
+      plan = []
+      for (name, name_ij), corners in groups.items():
+        i, j, multiple = zip(*corners)
+        plan.append((name, name_ij, (np.array(i), np.array(j)), np.array(multiple, dtype=float)))
+      plan = self._BC_Flexure_corner_plans[key] = tuple(plan)
+    for name, name_ij, index, multiple in plan:
+      self._cow(name)
+      getattr(self, name)[index] += multiple*getattr(self, name_ij+'_coeff_ij')[index]
+
+  # Functions to apply the periodic flexural boundary conditions, by side
+  _BC_Flexure_periodic = {
+    'W': BC_Flexure_W_Periodic,
+    'E': BC_Flexure_E_Periodic,
+    'N': BC_Flexure_N_Periodic,
+    'S': BC_Flexure_S_Periodic,
+  }
+
+  # The other boundary conditions are given by tables: for each side and
+  # boundary condition, the columns (W, E) or rows (N, S) that it changes,
+  # and in each of those, the terms added to the coefficient arrays, as
+  # (coefficient array, "_coeff_ij" array it is taken from, multiple).
+  _BC_Flexure_table = {
+    # West
+    ('W', '0Displacement0Slope'): (),
+    ('W', '0Moment0Shear'): (
+      (0, (('cj0i_1', 'cj_1i_1', 2),
+           ('cj0i0', 'cj_2i0', 4), ('cj0i0', 'cj_1i0', 2),
+           ('cj0i1', 'cj_1i1', 2),
+           ('cj1i_1', 'cj_1i_1', -1),
+           ('cj1i0', 'cj_2i0', -4), ('cj1i0', 'cj_1i0', -1),
+           ('cj1i1', 'cj_1i1', -1),
+           ('cj2i0', 'cj_2i0', 1))),
+      (1, (('cj_1i0', 'cj_2i0', 2),
+           ('cj1i0', 'cj_2i0', -2),
+           ('cj2i0', 'cj_2i0', 1))),
+    ),
+    ('W', '0Slope0Shear'): (
+      (0, (('cj1i_1', 'cj_1i_1', 1),
+           ('cj1i0', 'cj_1i0', 1),
+           ('cj1i1', 'cj_1i1', 1),
+           ('cj2i0', 'cj_2i0', 1))),
+      (1, (('cj2i0', 'cj_2i0', 1),)),
+    ),
+    ('W', 'Mirror'): (
+      (0, (('cj1i_1', 'cj_1i_1', 1),
+           ('cj1i0', 'cj_1i0', 1),
+           ('cj1i1', 'cj_1i1', 1),
+           ('cj2i0', 'cj_2i0', 1))),
+      (1, (('cj0i0', 'cj_2i0', 1),)),
+    ),
+    # East
+    ('E', '0Displacement0Slope'): (),
+    ('E', '0Moment0Shear'): (
+      (-1, (('cj_2i0', 'cj2i0', 1),
+            ('cj_1i_1', 'cj1i_1', -1),
+            ('cj_1i0', 'cj2i0', -4), ('cj_1i0', 'cj1i0', -1),
+            ('cj_1i1', 'cj1i1', -1),
+            ('cj0i_1', 'cj1i_1', 2),
+            ('cj0i0', 'cj2i0', 4), ('cj0i0', 'cj1i0', 2),
+            ('cj0i1', 'cj1i1', 2))),
+      (-2, (('cj_2i0', 'cj2i0', 1),
+            ('cj_1i0', 'cj2i0', -2),
+            ('cj1i0', 'cj2i0', 2))),
+    ),
+    ('E', '0Slope0Shear'): (
+      (-1, (('cj_2i0', 'cj2i0', 1),
+            ('cj_1i_1', 'cj1i_1', 1),
+            ('cj_1i0', 'cj1i0', 1),
+            ('cj_1i1', 'cj1i1', 1))),
+      (-2, (('cj_2i0', 'cj2i0', 1),)),
+    ),
+    ('E', 'Mirror'): (
+      (-1, (('cj_2i0', 'cj2i0', 1),
+            ('cj_1i_1', 'cj1i_1', 1),
+            ('cj_1i0', 'cj1i0', 1),
+            ('cj_1i1', 'cj1i1', 1))),
+      (-2, (('cj0i0', 'cj2i0', 1),)),
+    ),
+    # North
+    ('N', '0Displacement0Slope'): (),
+    ('N', '0Moment0Shear'): (
+      (0, (('cj_1i0', 'cj_1i_1', 2),
+           ('cj_1i1', 'cj_1i_1', -1),
+           ('cj0i0', 'cj0i_2', 4), ('cj0i0', 'cj0i_1', 2),
+           ('cj0i1', 'cj0i_2', -4), ('cj0i1', 'cj0i_1', -1),
+           ('cj0i2', 'cj0i_2', 1),
+           ('cj1i0', 'cj1i_1', 2),
+           ('cj1i1', 'cj1i_1', -1))),
+      (1, (('cj0i_1', 'cj0i_2', 2),
+           ('cj0i1', 'cj0i_2', -2),
+           ('cj0i2', 'cj0i_2', 1))),
+    ),
+    ('N', '0Slope0Shear'): (
+      (0, (('cj_1i1', 'cj_1i_1', 1),
+           ('cj0i1', 'cj0i_1', 1),
+           ('cj0i2', 'cj0i_2', 1),
+           ('cj1i1', 'cj1i_1', 1))),
+      (1, (('cj0i2', 'cj0i_2', 1),)),
+    ),
+    ('N', 'Mirror'): (
+      (0, (('cj_1i1', 'cj_1i_1', 1),
+           ('cj0i1', 'cj0i_1', 1),
+           ('cj0i2', 'cj0i_2', 1),
+           ('cj1i1', 'cj1i_1', 1))),
+      (1, (('cj0i0', 'cj0i_2', 1),)),
+    ),
+    # South
+    ('S', '0Displacement0Slope'): (),
+    ('S', '0Moment0Shear'): (
+      (-2, (('cj0i_2', 'cj0i2', 1),
+            ('cj0i_1', 'cj0i2', -2),
+            ('cj0i1', 'cj0i2', 2))),
+      (-1, (('cj_1i_1', 'cj1i1', -1),
+            ('cj_1i0', 'cj1i1', 2),
+            ('cj0i_2', 'cj0i2', 1),
+            ('cj0i_1', 'cj0i2', -4), ('cj0i_1', 'cj0i1', -1),
+            ('cj0i0', 'cj0i2', 4), ('cj0i0', 'cj0i1', 2),
+            ('cj1i_1', 'cj_1i1', -1),
+            ('cj1i0', 'cj_1i1', 2))),
+    ),
+    ('S', '0Slope0Shear'): (
+      (-2, (('cj0i_2', 'cj0i2', 1),)),
+      (-1, (('cj_1i_1', 'cj_1i1', 1),
+            ('cj0i_2', 'cj0i2', 1),
+            ('cj0i_1', 'cj0i1', 1),
+            ('cj1i_1', 'cj1i1', 1))),
+    ),
+    ('S', 'Mirror'): (
+      (-2, (('cj0i0', 'cj0i2', 1),)),
+      (-1, (('cj_1i_1', 'cj_1i1', 1),
+            ('cj0i_2', 'cj0i2', 1),
+            ('cj0i_1', 'cj0i1', 1),
+            ('cj1i_1', 'cj1i1', 1))),
+    ),
+  }
+
+  # Coefficients that reach off of the grid from the columns (W, E) or rows
+  # (N, S) nearest to each side, for all of the boundary conditions above
+  _BC_Flexure_offgrid = {
+    'W': ((0, ('cj_2i0', 'cj_1i_1', 'cj_1i0', 'cj_1i1')), (1, ('cj_2i0',))),
+    'E': ((-1, ('cj1i_1', 'cj1i0', 'cj1i1', 'cj2i0')), (-2, ('cj2i0',))),
+    'N': ((0, ('cj_1i_1',)),),
+    'S': (),
+  }
+
+  # Steps to apply the boundary conditions, by (BC_W, BC_E, BC_N, BC_S):
+  # built by BC_Flexure_plan the first time each combination is used
+  _BC_Flexure_plans = {}
+
+  def BC_Flexure_plan(self):
+    """
+    Steps to apply the flexural boundary conditions on each side, in order.
+    A step is the function for a periodic boundary condition; for the others,
+    it is the arrays to copy-on-write, the off-grid coefficients to flag,
+    and the terms to add, as (array, index, "_coeff_ij" array, multiple),
+    from _BC_Flexure_table and _BC_Flexure_offgrid. These depend only on the
+    boundary conditions, so the tables are read once for each combination
+    """
+    key = (self.BC_W, self.BC_E, self.BC_N, self.BC_S)
+    try:
+      return self._BC_Flexure_plans[key]
+    except KeyError:
+      pass
+    plan = []
+    for side, bc in zip(('W', 'E', 'N', 'S'), key):
+      if bc == 'Periodic':
+        plan.append(self._BC_Flexure_periodic[side])
+        continue
+      try:
+        rows = self._BC_Flexure_table[side, bc]
+      except KeyError:
+        # Possibly redundant safeguard
+        sys.exit("Invalid boundary condition")
+      if side == 'W' or side == 'E':
+        at = lambda k: np.s_[:,k]
+      else:
+        at = lambda k: np.s_[k,:]
+      offgrid = tuple((name, at(k)) for k, names in self._BC_Flexure_offgrid[side]
+                                    for name in names)
+      terms = tuple((name, at(k), name_ij, multiple) for k, row in rows
+                                                     for name, name_ij, multiple in row)
+      cow = tuple(sorted(set(term[0] for term in terms)))
+      plan.append((cow, offgrid, terms))
+    plan = self._BC_Flexure_plans[key] = tuple(plan)
+    return plan
+
+  # Shifts (in y, x) for each coefficient array, so that its values end up
+  # at the proper places along its diagonal of the coefficient matrix
+  _diagonal_shifts = {
+    'cj_2i0': (0, -2), 'cj_1i0': (0, -1), 'cj0i0': (0, 0),
+    'cj1i0': (0, 1), 'cj2i0': (0, 2),
+    'cj0i_2': (-2, 0), 'cj0i_1': (-1, 0), 'cj0i1': (1, 0), 'cj0i2': (2, 0),
+    'cj_1i_1': (-1, -1), 'cj_1i1': (1, -1), 'cj1i_1': (-1, 1), 'cj1i1': (1, 1),
+    'cj_2i0_Periodic_right': (0, -2), 'cj_1i1_Periodic_right': (1, -1),
+    'cj1i_1_Periodic_left': (-1, 1), 'cj2i0_Periodic_left': (0, 2),
+    }
+
+  def _roll(self, name, out):
+    """
+    Writes np.roll(np.roll(a, shift_y, 0), shift_x, 1) for the coefficient
+    array "name" into "out" in one pass, with the shifts from
+    _diagonal_shifts, and keeps the shifted array as "name"
+    """
+    a = getattr(self, name)
+    shift_y, shift_x = self._diagonal_shifts[name]
+    ny, nx = a.shape
+    sy = shift_y % ny
+    sx = shift_x % nx
+    # Copy the (up to) four blocks that wrap around to their new places
+    for dst_y, src_y in ((slice(sy, None), slice(0, ny-sy)),
+                         (slice(0, sy), slice(ny-sy, None))):
+      for dst_x, src_x in ((slice(sx, None), slice(0, nx-sx)),
+                           (slice(0, sx), slice(nx-sx, None))):
+        out[dst_y, dst_x] = a[src_y, src_x]
+    setattr(self, name, out)
+
+  def _fill_diagonals(self, names):
+    """
+    Builds self.diags, with one row per name in "names": each row is the
+    shifted coefficient array of that name, flattened. The shifts write
+    straight into the rows, and the array from the last run is reused if it
+    has the same size, so no intermediate arrays are stacked together
+    """
+    dtype = np.result_type(*[getattr(self, name) for name in set(names)])
+    shape = (len(names), self.ny*self.nx)
+    diags = getattr(self, 'diags', None)
+    if diags is None or diags.shape != shape or diags.dtype != dtype:
+      diags = np.empty(shape, dtype=dtype)
+    first_row = {}
+    for k, name in enumerate(names):
+      if name in first_row:
+        # Repeated diagonals (periodic b.c.'s) are copies of the first one
+        diags[k] = diags[first_row[name]]
+      else:
+        self._roll(name, diags[k].reshape(self.ny, self.nx))
+        first_row[name] = k
+    self.diags = diags
+
+  # Diagonals of the coefficient matrix for each combination of periodic
+  # boundary conditions, as (coefficient array, offset): each offset is given
+  # by the multiples of (ny*nx, nx, 1) that add up to it.
+  # Changed this 6 Nov. 2014 in betahaus Berlin to be x-based
+  _diagonal_layouts = {
+    # No periodic boundary conditions -- original form of coeff_matrix
+    # creator.
+    None: (
+      ('cj0i_2', (0, -2, 0)),
+      ('cj_1i_1', (0, -1, -1)), ('cj0i_1', (0, -1, 0)), ('cj1i_1', (0, -1, 1)),
+      ('cj_2i0', (0, 0, -2)), ('cj_1i0', (0, 0, -1)), ('cj0i0', (0, 0, 0)),
+        ('cj1i0', (0, 0, 1)), ('cj2i0', (0, 0, 2)),
+      ('cj_1i1', (0, 1, -1)), ('cj0i1', (0, 1, 0)), ('cj1i1', (0, 1, 1)),
+      ('cj0i2', (0, 2, 0)),
+    ),
+    # Periodic N-S: we need to wrap around the ends of the large-scale
+    # diagonal structure
+    'NS': (
+      # Lower left
+      ('cj_1i1', (-1, 1, -1)), ('cj0i1', (-1, 1, 0)), ('cj1i1', (-1, 1, 1)),
+      ('cj0i2', (-1, 2, 0)),
+      # Middle
+      ('cj0i_2', (0, -2, 0)),
+      ('cj_1i_1', (0, -1, -1)), ('cj0i_1', (0, -1, 0)), ('cj1i_1', (0, -1, 1)),
+      ('cj_2i0', (0, 0, -2)), ('cj_1i0', (0, 0, -1)), ('cj0i0', (0, 0, 0)),
+        ('cj1i0', (0, 0, 1)), ('cj2i0', (0, 0, 2)),
+      ('cj_1i1', (0, 1, -1)), ('cj0i1', (0, 1, 0)), ('cj1i1', (0, 1, 1)),
+      ('cj0i2', (0, 2, 0)),
+      # Upper right
+      ('cj0i_2', (1, -2, 0)),
+      ('cj_1i_1', (1, -1, -1)), ('cj0i_1', (1, -1, 0)), ('cj1i_1', (1, -1, 1)),
+    ),
+    # Periodic E-W: additional diagonals from the W (Periodic_right) and E
+    # (Periodic_left) arrays
+    'EW': (
+      ('cj0i_2', (0, -2, 0)),
+      # New:
+      ('cj1i_1_Periodic_left', (0, -2, 1)),
+      # Right term here (-self.nx+1) modified:
+      ('cj_1i_1', (0, -1, -1)), ('cj0i_1', (0, -1, 0)), ('cj1i_1', (0, -1, 1)),
+      # New:
+      ('cj2i0_Periodic_left', (0, -1, 2)),
+      # -1 and 1 terms here modified:
+      ('cj_2i0', (0, 0, -2)), ('cj_1i0', (0, 0, -1)), ('cj0i0', (0, 0, 0)),
+        ('cj1i0', (0, 0, 1)), ('cj2i0', (0, 0, 2)),
+      # New:
+      ('cj_2i0_Periodic_right', (0, 1, -2)),
+      # Left term here (self.nx-1) modified:
+      ('cj_1i1', (0, 1, -1)), ('cj0i1', (0, 1, 0)), ('cj1i1', (0, 1, 1)),
+      # New:
+      ('cj_1i1_Periodic_right', (0, 2, -1)),
+      ('cj0i2', (0, 2, 0)),
+    ),
+    # Periodic on all sides
+    # I think the fact that everything is rolled will make this work all right
+    # without any additional rolling.
+    # Checked -- and indeed, what would be in my mind the last value for 
+    # Mid[3] is the first value in its array. Hooray, patterns!
+    'NSEW': (
+      # New: LL corner of LL box
+      ('cj1i_1_Periodic_left', (-1, 0, 1)),
+      # Periodic b.c. tridiag
+      ('cj_1i1', (-1, 1, -1)), ('cj0i1', (-1, 1, 0)), ('cj1i1', (-1, 1, 1)),
+      # New: UR corner of LL box
+      ('cj_1i1_Periodic_right', (-1, 2, -1)),
+      # Periodic b.c. single diag
+      ('cj0i2', (-1, 2, 0)),
+      ('cj0i_2', (0, -2, 0)),
+      # New:
+      ('cj1i_1_Periodic_left', (0, -2, 1)),
+      # Right term here (-self.nx+1) modified:
+      ('cj_1i_1', (0, -1, -1)), ('cj0i_1', (0, -1, 0)), ('cj1i_1', (0, -1, 1)),
+      # New:
+      ('cj2i0_Periodic_left', (0, -1, 2)),
+      # -1 and 1 terms here modified:
+      ('cj_2i0', (0, 0, -2)), ('cj_1i0', (0, 0, -1)), ('cj0i0', (0, 0, 0)),
+        ('cj1i0', (0, 0, 1)), ('cj2i0', (0, 0, 2)),
+      # New:
+      ('cj_2i0_Periodic_right', (0, 1, -2)),
+      # Left term here (self.nx-1) modified:
+      ('cj_1i1', (0, 1, -1)), ('cj0i1', (0, 1, 0)), ('cj1i1', (0, 1, 1)),
+      # New:
+      ('cj_1i1_Periodic_right', (0, 2, -1)),
+      ('cj0i2', (0, 2, 0)),
+      # Periodic b.c. single diag
+      ('cj0i_2', (1, -2, 0)),
+      # New: LL corner of UR box
+      ('cj1i_1_Periodic_left', (1, -2, 1)),
+      # Periodic b.c. tridiag
+      ('cj_1i_1', (1, -1, -1)), ('cj0i_1', (1, -1, 0)), ('cj1i_1', (1, -1, 1)),
+      # New: UR corner of UR box
+      ('cj_1i1_Periodic_right', (1, 0, -1)),
+    ),
+  }
+
+  def diagonal_layout(self):
+    """
+    The diagonals of the coefficient matrix, from _diagonal_layouts, for the
+    periodic boundary conditions in use
+    """
+    periodic_NS = (self.BC_N == 'Periodic' and self.BC_S == 'Periodic')
+    periodic_EW = (self.BC_W == 'Periodic' and self.BC_E == 'Periodic')
+    if periodic_NS and periodic_EW:
+      return self._diagonal_layouts['NSEW']
+    elif periodic_EW:
+      return self._diagonal_layouts['EW']
+    elif periodic_NS:
+      return self._diagonal_layouts['NS']
+    else:
+      return self._diagonal_layouts[None]
 
   def build_diagonals(self):
 
@@ -1272,226 +1376,37 @@ class F2D(Flexure):
     # arrays: Python will naturally just do vertical shifts instead of 
     # diagonal shifts, so this takes into account the horizontal compoent 
     # to ensure that boundary values are at the right place.
-        
-    # Roll x
+    # (_fill_diagonals does this with the shifts in _diagonal_shifts, writing
+    # each shifted array directly into its row of self.diags)
 # ASYMMETRIC RESPONSE HERE -- THIS GETS TOWARDS SOURCE OF PROBLEM!
-    self.cj_2i0 = np.roll(self.cj_2i0, -2, 1)
-    self.cj_1i0 = np.roll(self.cj_1i0, -1, 1)
-    self.cj1i0 = np.roll(self.cj1i0, 1, 1)
-    self.cj2i0 = np.roll(self.cj2i0, 2, 1)
-    # Roll y
-    self.cj0i_2 = np.roll(self.cj0i_2, -2, 0)
-    self.cj0i_1 = np.roll(self.cj0i_1, -1, 0)
-    self.cj0i1 = np.roll(self.cj0i1, 1, 0)
-    self.cj0i2 = np.roll(self.cj0i2, 2, 0)
-    # Roll x and y
-    self.cj_1i_1 = np.roll(self.cj_1i_1, -1, 1)
-    self.cj_1i_1 = np.roll(self.cj_1i_1, -1, 0)
-    self.cj_1i1 = np.roll(self.cj_1i1, -1, 1)
-    self.cj_1i1 = np.roll(self.cj_1i1, 1, 0)
-    self.cj1i_1 = np.roll(self.cj1i_1, 1, 1)
-    self.cj1i_1 = np.roll(self.cj1i_1, -1, 0)
-    self.cj1i1 = np.roll(self.cj1i1, 1, 1)
-    self.cj1i1 = np.roll(self.cj1i1, 1, 0)
-
-    coeff_array_list = [self.cj_2i0, self.cj_1i0, self.cj1i0, self.cj2i0, self.cj0i_2, self.cj0i_1, self.cj0i1, self.cj0i2, self.cj_1i_1, self.cj_1i1, self.cj1i_1, self.cj1i1, self.cj0i0]
-    for array in coeff_array_list:
-      array[np.isinf(array)] = 0
-     #array[np.isnan(array)] = 0 # had been used for testing
-    
-    # Reshape to put in solver
-    vec_cj_2i0 = np.reshape(self.cj_2i0, -1, order='C')
-    vec_cj_1i_1 = np.reshape(self.cj_1i_1, -1, order='C')
-    vec_cj_1i0 = np.reshape(self.cj_1i0, -1, order='C')
-    vec_cj_1i1 = np.reshape(self.cj_1i1, -1, order='C')
-    vec_cj0i_2 = np.reshape(self.cj0i_2, -1, order='C')
-    vec_cj0i_1 = np.reshape(self.cj0i_1, -1, order='C')
-    vec_cj0i0 = np.reshape(self.cj0i0, -1, order='C')
-    vec_cj0i1 = np.reshape(self.cj0i1, -1, order='C')
-    vec_cj0i2 = np.reshape(self.cj0i2, -1, order='C')
-    vec_cj1i_1 = np.reshape(self.cj1i_1, -1, order='C')
-    vec_cj1i0 = np.reshape(self.cj1i0, -1, order='C')
-    vec_cj1i1 = np.reshape(self.cj1i1, -1, order='C')
-    vec_cj2i0 = np.reshape(self.cj2i0, -1, order='C')
-    
-    # Changed this 6 Nov. 2014 in betahaus Berlin to be x-based
-    Up2 = vec_cj0i2
-    Up1 = np.vstack(( vec_cj_1i1, vec_cj0i1, vec_cj1i1 ))
-    Mid = np.vstack(( vec_cj_2i0, vec_cj_1i0, vec_cj0i0, vec_cj1i0, vec_cj2i0 ))
-    Dn1 = np.vstack(( vec_cj_1i_1, vec_cj0i_1, vec_cj1i_1 ))
-    Dn2 = vec_cj0i_2
 
     # Number of rows and columns for array size and offsets
     self.ny = self.nrowsy
     self.nx = self.ncolsx
 
-    if (self.BC_N == 'Periodic' and self.BC_S == 'Periodic' and \
-        self.BC_W == 'Periodic' and self.BC_E == 'Periodic' ):
-      # Additional vector creation
-      # West
-      # Roll
-      self.cj_2i0_Periodic_right = np.roll(self.cj_2i0_Periodic_right, -2, 1)
-      self.cj_1i1_Periodic_right = np.roll(self.cj_1i1_Periodic_right, -1, 1)
-      self.cj_1i1_Periodic_right = np.roll(self.cj_1i1_Periodic_right, 1, 0)
-      # Reshape
-      vec_cj_2i0_Periodic_right = np.reshape(self.cj_2i0_Periodic_right, -1, order='C')
-      vec_cj_1i1_Periodic_right = np.reshape(self.cj_1i1_Periodic_right, -1, order='C')
-      # East
-      # Roll
-      self.cj1i_1_Periodic_left = np.roll(self.cj1i_1_Periodic_left, 1, 1)
-      self.cj1i_1_Periodic_left = np.roll(self.cj1i_1_Periodic_left, -1, 0)
-      self.cj2i0_Periodic_left = np.roll(self.cj2i0_Periodic_left, 2, 1)
-      # Reshape
-      vec_cj1i_1_Periodic_left = np.reshape(self.cj1i_1_Periodic_left, -1, order='C')
-      vec_cj2i0_Periodic_left = np.reshape(self.cj2i0_Periodic_left, -1, order='C')
-    
-      # Build diagonals with additional entries
-      # I think the fact that everything is rolled will make this work all right
-      # without any additional rolling.
-      # Checked -- and indeed, what would be in my mind the last value for 
-      # Mid[3] is the first value in its array. Hooray, patterns!
-      self.diags = np.vstack(( vec_cj1i_1_Periodic_left,
-                               Up1,
-                               vec_cj_1i1_Periodic_right,
-                               Up2,
-                               Dn2,
-                               vec_cj1i_1_Periodic_left,
-                               Dn1,
-                               vec_cj2i0_Periodic_left,
-                               Mid,
-                               vec_cj_2i0_Periodic_right,
-                               Up1,
-                               vec_cj_1i1_Periodic_right,
-                               Up2,
-                               Dn2,
-                               vec_cj1i_1_Periodic_left,
-                               Dn1,
-                               vec_cj_1i1_Periodic_right ))
-      # Getting too complicated to have everything together
-      self.offsets = [
-                      # New: LL corner of LL box
-                      -self.ny*self.nx+1,
-                      # Periodic b.c. tridiag
-                      self.nx-self.ny*self.nx-1, self.nx-self.ny*self.nx, self.nx-self.ny*self.nx+1,
-                      # New: UR corner of LL box
-                      2*self.nx-self.ny*self.nx-1,
-                      # Periodic b.c. single diag
-                      2*self.nx-self.ny*self.nx,
-                      -2*self.nx,
-                      # New:
-                      -2*self.nx+1,
-                      # Right term here (-self.nx+1) modified:
-                      -self.nx-1, -self.nx, -self.nx+1,
-                      # New:
-                      -self.nx+2,
-                      # -1 and 1 terms here modified:
-                      -2, -1, 0, 1, 2,
-                      # New:
-                      self.nx-2,
-                      # Left term here (self.nx-1) modified:
-                      self.nx-1, self.nx, self.nx+1,
-                      # New:
-                      2*self.nx-1,
-                      2*self.nx,
-                      # Periodic b.c. single diag
-                      self.ny*self.nx-2*self.nx,
-                      # New: LL corner of UR box
-                      self.ny*self.nx-2*self.nx+1,
-                      # Periodic b.c. tridiag
-                      self.ny*self.nx-self.nx-1, self.ny*self.nx-self.nx, self.ny*self.nx-self.nx+1,
-                      # New: UR corner of UR box
-                      self.ny*self.nx-1
-                     ]
-
-      # create banded sparse matrix
-      self.coeff_matrix = scipy.sparse.spdiags(self.diags, self.offsets,
-        self.ny*self.nx, self.ny*self.nx, format='csr') 
-    
-    elif (self.BC_W == 'Periodic' and self.BC_E == 'Periodic'):
-      # Additional vector creation
-      # West
-      # Roll
-      self.cj_2i0_Periodic_right = np.roll(self.cj_2i0_Periodic_right, -2, 1)
-      self.cj_1i1_Periodic_right = np.roll(self.cj_1i1_Periodic_right, -1, 1)
-      self.cj_1i1_Periodic_right = np.roll(self.cj_1i1_Periodic_right, 1, 0)
-      # Reshape
-      vec_cj_2i0_Periodic_right = np.reshape(self.cj_2i0_Periodic_right, -1, order='C')
-      vec_cj_1i1_Periodic_right = np.reshape(self.cj_1i1_Periodic_right, -1, order='C')
-      # East
-      # Roll
-      self.cj1i_1_Periodic_left = np.roll(self.cj1i_1_Periodic_left, 1, 1)
-      self.cj1i_1_Periodic_left = np.roll(self.cj1i_1_Periodic_left, -1, 0)
-      self.cj2i0_Periodic_left = np.roll(self.cj2i0_Periodic_left, 2, 1)
-      # Reshape
-      vec_cj1i_1_Periodic_left = np.reshape(self.cj1i_1_Periodic_left, -1, order='C')
-      vec_cj2i0_Periodic_left = np.reshape(self.cj2i0_Periodic_left, -1, order='C')
-
-      # Build diagonals with additional entries
-      self.diags = np.vstack(( Dn2,
-                               vec_cj1i_1_Periodic_left,
-                               Dn1,
-                               vec_cj2i0_Periodic_left,
-                               Mid,
-                               vec_cj_2i0_Periodic_right,
-                               Up1,
-                               vec_cj_1i1_Periodic_right,
-                               Up2 ))
-      # Getting too complicated to have everything together
-      self.offsets = [-2*self.nx,
-                      # New:
-                      -2*self.nx+1,
-                      # Right term here (-self.nx+1) modified:
-                      -self.nx-1, -self.nx, -self.nx+1,
-                      # New:
-                      -self.nx+2,
-                      # -1 and 1 terms here modified:
-                      -2, -1, 0, 1, 2,
-                      # New:
-                      self.nx-2,
-                      # Left term here (self.nx-1) modified:
-                      self.nx-1, self.nx, self.nx+1,
-                      # New:
-                      2*self.nx-1,
-                      2*self.nx]
-
-      # create banded sparse matrix
-      self.coeff_matrix = scipy.sparse.spdiags(self.diags, self.offsets,
-        self.ny*self.nx, self.ny*self.nx, format='csr') 
-    
-    elif (self.BC_N == 'Periodic' and self.BC_S == 'Periodic'):
-      # Periodic.
-      # If these are periodic, we need to wrap around the ends of the
-      # large-scale diagonal structure
-      self.diags = np.vstack(( Up1,
-                               Up2,
-                               Dn2,
-                               Dn1,
-                               Mid,
-                               Up1,
-                               Up2,
-                               Dn2,
-                               Dn1 ))
-      # Create banded sparse matrix
-      # Rows:
-      #      Lower left
-      #      Middle
-      #      Upper right
-      self.coeff_matrix = scipy.sparse.spdiags(self.diags, [self.nx-self.ny*self.nx-1, self.nx-self.ny*self.nx, self.nx-self.ny*self.nx+1, 2*self.nx-self.ny*self.nx,
-                                                            -2*self.nx, -self.nx-1, -self.nx, -self.nx+1, -2, -1, 0, 1, 2, self.nx-1, self.nx, self.nx+1, 2*self.nx,
-                                                            self.ny*self.nx-2*self.nx, self.ny*self.nx-self.nx-1, self.ny*self.nx-self.nx, self.ny*self.nx-self.nx+1],
-                                                            self.ny*self.nx, self.ny*self.nx, format='csr')
-                                                            
+    # Only the diagonals needed for these boundary conditions are built
+    layout = self.diagonal_layout()
+    self._fill_diagonals([name for name, _ in layout])
+    # The offsets depend only on the grid size and the layout, so are kept
+    # until one of those changes
+    if self._offsets_key != (self.ny, self.nx, layout):
+      self.offsets = np.array([a*self.ny*self.nx + b*self.nx + c
+                               for _, (a, b, c) in layout], dtype=np.intc)
+      self._offsets_key = (self.ny, self.nx, layout)
+
+    # Create banded sparse matrix
+    if self.Solver == "iterative" or self.Solver == "Iterative":
+      # The iterative solution only multiplies by the matrix, which is
+      # fastest with the diagonals stored as they are (DIA), with no column
+      # indices to read. These are copied so that the matrix does not share
+      # self.diags, which is reused by the next build
+      self.coeff_matrix = scipy.sparse.dia_matrix((self.diags, self.offsets),
+        shape=(self.ny*self.nx, self.ny*self.nx), copy=True)
     else:
-      # No periodic boundary conditions -- original form of coeff_matrix
-      # creator.
-      # Arrange in solver
-      self.diags = np.vstack(( Dn2,
-                               Dn1,
-                               Mid,
-                               Up1,
-                               Up2 ))
-      # Create banded sparse matrix
-      self.coeff_matrix = scipy.sparse.spdiags(self.diags, [-2*self.nx, -self.nx-1, -self.nx, -self.nx+1, -2, -1, 0, 1, 2, self.nx-1, self.nx, self.nx+1, 2*self.nx], self.ny*self.nx, self.ny*self.nx, format='csr') # create banded sparse matrix
+      # The diagonals are handed to dia_matrix without a copy, and converted
+      # once into CSR for the direct solver
+      self.coeff_matrix = scipy.sparse.dia_matrix((self.diags, self.offsets),
+        shape=(self.ny*self.nx, self.ny*self.nx), copy=False).tocsr()
 
   def calc_max_flexural_wavelength(self):
     """
@@ -1501,10 +1416,9 @@ class F2D(Flexure):
     case, the flexural wavelength is a good characteristic distance for any 
     truncation limit
     """
-    if np.isscalar(self.D):
-      Dmax = self.D
-    else:
-      Dmax = self.D.max()
+    # (np.max also takes a scalar D; a Python float keeps the arithmetic
+    # below out of NumPy)
+    Dmax = float(np.max(self.D))
     # This is an approximation if there is fill that evolves with iterations 
     # (e.g., water), but should be good enough that this won't do much to it
     alpha = (4*Dmax/(self.drho*self.g))**.25 # 2D flexural parameter
@@ -1524,23 +1438,82 @@ class F2D(Flexure):
     """
     
     if self.Debug:
-      try:
-        # Will fail if scalar
+      if not np.isscalar(self.Te):
         print("self.Te", self.Te.shape)
-      except:
-        pass
       print("self.qs", self.qs.shape)
       self.calc_max_flexural_wavelength()
       print("maxFlexuralWavelength_ncells: (x, y):", self.maxFlexuralWavelength_ncells_x, self.maxFlexuralWavelength_ncells_y)
     
-    q0vector = self.qs.reshape(-1, order='C')
+    # A view of the loads if they are C-contiguous (copied once if not)
+    q0vector = np.ascontiguousarray(self.qs).ravel()
     if self.Solver == "iterative" or self.Solver == "Iterative":
-      if self.Debug:
-        print("Using generalized minimal residual method for iterative solution")
       if self.Verbose:
-        print("Converging to a tolerance of", self.iterative_ConvergenceTolerance, "m between iterations")
-      wvector = scipy.sparse.linalg.isolve.lgmres(self.coeff_matrix, q0vector)#, tol=1E-10)#,x0=woldvector)#,x0=wvector,tol=1E-15)    
-      wvector = wvector[0] # Reach into tuple to get my array back
+        print("Converging to a relative residual of", self.iterative_ConvergenceTolerance)
+      # The iterations are done with a copy of the matrix in self.dtype:
+      # np.float32 halves the memory traffic of their matrix-vector products.
+      # The copy is made once for each matrix
+      dtype = np.dtype(self.dtype)
+      if dtype == self.coeff_matrix.dtype:
+        A = self.coeff_matrix
+      else:
+        if self.coeff_matrix is not self._iteration_matrix_of:
+          self._iteration_matrix = self.coeff_matrix.astype(dtype)
+          self._iteration_matrix_of = self.coeff_matrix
+        A = self._iteration_matrix
+      # The matrix is symmetric only for some combinations of elastic
+      # thickness and boundary conditions (e.g., constant Te with
+      # 0Displacement0Slope or Periodic b.c.'s); the conjugate gradient method
+      # converges faster then, and needs no more than a few vectors. Checked
+      # once for each matrix. Large compressive in-plane stresses can keep it
+      # symmetric but make it indefinite, so if conjugate gradients fail, the
+      # solution falls back to lgmres.
+      if self.coeff_matrix is not self._symmetry_checked_matrix:
+        self._symmetric = (self.coeff_matrix != self.coeff_matrix.T).nnz == 0
+        self._symmetry_checked_matrix = self.coeff_matrix
+      if self._symmetric:
+        # With Preconditioner = "multigrid" (and pyamg installed), precondition
+        # with a multigrid V-cycle, which keeps the number of iterations from
+        # growing with the size of the grid. Its hierarchy is built once for
+        # each matrix. This only pays off on large grids, and not at all on
+        # periodic ones, so it is off by default. (Not used for the
+        # non-symmetric matrices: it slows down lgmres on them)
+        M = None
+        if self.Preconditioner == "multigrid":
+          try:
+            import pyamg
+          except ImportError:
+            pyamg = None
+            if self.Quiet == False:
+              print("pyamg is not installed: solving without a preconditioner")
+          if pyamg is not None and A is not self._multigrid_matrix:
+            if self.Debug:
+              print("Building smoothed aggregation multigrid preconditioner")
+            self._multigrid = pyamg.smoothed_aggregation_solver(A.tocsr())
+            self._multigrid_matrix = A
+          if pyamg is not None:
+            M = self._multigrid.aspreconditioner(cycle='V')
+        if self.Debug:
+          print("Using conjugate gradient method for iterative solution")
+        solve = lambda b: self.iterative_solve(scipy.sparse.linalg.cg, A, b, M=M,
+                                               fallback=scipy.sparse.linalg.lgmres)
+      else:
+        if self.Debug:
+          print("Using generalized minimal residual method for iterative solution")
+        solve = lambda b: self.iterative_solve(scipy.sparse.linalg.lgmres, A, b)#,x0=woldvector)#,x0=wvector,tol=1E-15)    
+      wvector = solve(q0vector.astype(A.dtype, copy=False))
+      # In single precision, do one step of iterative refinement: the
+      # residual is computed with the double-precision matrix, and the
+      # correction for it is solved for in single precision again. (Rounding
+      # the matrix to single precision otherwise limits the accuracy of the
+      # solution to ~1E-3, whatever the convergence tolerance)
+      if A is not self.coeff_matrix:
+        wvector = wvector.astype(self.coeff_matrix.dtype)
+        residual = q0vector - self.coeff_matrix.dot(wvector)
+        wvector += solve(residual.astype(A.dtype))
+        if self.Debug:
+          print("Relative residual after iterative refinement:",
+                np.linalg.norm(q0vector - self.coeff_matrix.dot(wvector)) \
+                / np.linalg.norm(q0vector))
     else:
       if self.Solver == "direct" or self.Solver == "Direct":
         if self.Debug:
@@ -1549,10 +1522,36 @@ class F2D(Flexure):
         if self.Quiet == False:
           print("Solution type not understood:")
           print("Defaulting to direct solution with UMFpack")
-      wvector = scipy.sparse.linalg.spsolve(self.coeff_matrix, q0vector, use_umfpack=True)
-
-    # Reshape into grid
-    self.w = -wvector.reshape(self.qs.shape)
-    self.w_padded = self.w.copy() # for troubleshooting
+      # UMFpack only works in double precision, so the direct solution is
+      # always done in it (self.dtype is left as it is, for a later
+      # iterative solution)
+      if np.dtype(self.dtype) != np.float64 and self.Quiet == False:
+        print("Direct solution requires double precision: using np.float64")
+      # Factorize the matrix only once: later solves with the same matrix
+      # (e.g., only the loads change between runs) reuse the factors.
+      # scipy.sparse.linalg.factorized uses UMFpack if it is installed, and
+      # SuperLU if not, as spsolve does
+      if self.coeff_matrix is not self._factorized_matrix \
+        or self.DirectSolver != self._factorized_with:
+        if self.DirectSolver == "SuperLU" or self.DirectSolver == "superlu":
+          if self.Debug:
+            print("Factorizing with SuperLU")
+          self._factorized_solve = scipy.sparse.linalg.splu(self.coeff_matrix.tocsc()).solve
+        else:
+          if self.DirectSolver != "UMFpack" and self.DirectSolver != "umfpack":
+            if self.Quiet == False:
+              print("Direct solver not understood:", self.DirectSolver)
+              print("Defaulting to UMFpack")
+          self._factorized_solve = scipy.sparse.linalg.factorized(self.coeff_matrix.tocsc())
+        self._factorized_matrix = self.coeff_matrix
+        self._factorized_with = self.DirectSolver
+      wvector = self._factorized_solve(q0vector)
+
+    # Reshape into grid; the solution vector is a new array, so it is negated
+    # in place
+    np.negative(wvector, out=wvector)
+    self.w = wvector.reshape(self.qs.shape)
+    if self.Debug:
+      self.w_padded = self.w.copy() # for troubleshooting
 
     # Time to solve used to be here
@@ -0,0 +1,35 @@
+import gflex
+import pytest
+
+@pytest.fixture
+def flexure():
+    """
+    flex = flexure(**kwargs)
+
+    Runs a 2D plate (finite difference, direct solution, constant Te and
+    clamped edges unless the keyword arguments set otherwise) and returns
+    it. The keyword arguments are set as attributes before it is initialized:
+    the loads (qs, or x, y and q for SAS_NG) must be among them.
+    """
+    def flexure(**kwargs):
+        flex = gflex.F2D()
+        flex.Quiet = True
+        flex.Method = 'FD'
+        flex.PlateSolutionType = 'vWC1994'
+        flex.Solver = 'direct'
+        flex.g = 9.8
+        flex.E = 65E9
+        flex.nu = 0.25
+        flex.rho_m = 3300.
+        flex.rho_fill = 0.
+        flex.Te = 30000.
+        flex.dx = 5000.
+        flex.dy = 5000.
+        flex.BC_W = flex.BC_E = flex.BC_N = flex.BC_S = '0Displacement0Slope'
+        for key in kwargs:
+            setattr(flex, key, kwargs[key])
+        flex.initialize()
+        flex.run()
+        flex.finalize()
+        return flex
+    return flexure
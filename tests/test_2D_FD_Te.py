@@ -0,0 +1,67 @@
+#! /usr/bin/env python
+
+import gflex
+import numpy as np
+
+# A centered square load on a 40x40 grid
+qs = np.zeros((40, 40))
+qs[15:25, 15:25] += 1E6
+
+stresses = [{},
+            {'sigma_xx': 1E7},
+            {'sigma_yy': 1E7},
+            {'sigma_xy': 1E7},
+            {'sigma_xx': -1E7, 'sigma_yy': 5E6, 'sigma_xy': 3E6}]
+
+def test_scalar_Te_matches_uniform_Te(flexure):
+    for sigma in stresses:
+        w_scalar = flexure(qs=qs, dy=7000., **sigma).w
+        for PlateSolutionType in ('vWC1994', 'G2009'):
+            w_array = flexure(qs=qs, dy=7000., Te=30000.*np.ones((40, 40)),
+                              PlateSolutionType=PlateSolutionType, **sigma).w
+            np.testing.assert_allclose(w_array, w_scalar, rtol=0,
+                                       atol=1E-9*np.abs(w_scalar).max())
+
+def test_stresses_keep_the_solution_symmetric(flexure):
+    for sigma in stresses:
+        w = flexure(qs=qs, dy=7000., **sigma).w
+        atol = 1E-9*np.abs(w).max()
+        # Normal stresses keep the mirror symmetry of the load; the shear
+        # stress only its symmetry under a half turn
+        np.testing.assert_allclose(w, w[::-1, ::-1], rtol=0, atol=atol)
+        if 'sigma_xy' not in sigma:
+            np.testing.assert_allclose(w, w[:, ::-1], rtol=0, atol=atol)
+            np.testing.assert_allclose(w, w[::-1, :], rtol=0, atol=atol)
+
+def test_normal_stresses_match_1D(flexure):
+    # A load that is uniform along one axis, on a plate that is periodic
+    # along it, bends as the 1D plate does, stresses included
+    for sigma in (3E8, -3E8):
+        flex = gflex.F1D()
+        flex.Quiet = True
+        flex.Method = 'FD'
+        flex.Solver = 'direct'
+        flex.g = 9.8
+        flex.E = 65E9
+        flex.nu = 0.
+        flex.rho_m = 3300.
+        flex.rho_fill = 0.
+        flex.Te = 30000.
+        flex.qs = np.zeros(60)
+        flex.qs[25:35] += 1E6
+        flex.dx = 5000.
+        flex.BC_W = flex.BC_E = '0Displacement0Slope'
+        flex.sigma_xx = sigma
+        flex.initialize()
+        flex.run()
+        flex.finalize()
+        qs_strip = np.zeros((8, 60))
+        qs_strip[:, 25:35] += 1E6
+        w = flexure(qs=qs_strip, nu=0., sigma_xx=sigma,
+                    BC_N='Periodic', BC_S='Periodic').w
+        np.testing.assert_allclose(w[4], flex.w, rtol=0,
+                                   atol=1E-9*np.abs(flex.w).max())
+        w = flexure(qs=qs_strip.T.copy(), Te=30000.*np.ones((60, 8)), nu=0.,
+                    sigma_yy=sigma, BC_W='Periodic', BC_E='Periodic').w
+        np.testing.assert_allclose(w[:, 4], flex.w, rtol=0,
+                                   atol=1E-9*np.abs(flex.w).max())
@@ -0,0 +1,26 @@
+#! /usr/bin/env python
+
+import numpy as np
+import pytest
+
+qs = np.zeros((12, 15))
+qs[4:8, 5:10] += 1E6
+
+def boundary_conditions(BC_W, BC_E, BC_N, BC_S):
+    return {'BC_W': BC_W, 'BC_E': BC_E, 'BC_N': BC_N, 'BC_S': BC_S}
+
+def test_unpaired_periodic_boundary_conditions_exit(flexure):
+    for bcs in [('Periodic', 'Mirror', 'Periodic', 'Periodic'),
+                ('0Moment0Shear', 'Periodic', 'Mirror', 'Mirror'),
+                ('Mirror', 'Mirror', 'Periodic', '0Displacement0Slope'),
+                ('Periodic', 'Periodic', '0Slope0Shear', 'Periodic')]:
+        with pytest.raises(SystemExit) as exit:
+            flexure(qs=qs, **boundary_conditions(*bcs))
+        assert 'wrap-around' in str(exit.value)
+
+def test_paired_periodic_boundary_conditions_run(flexure):
+    for bcs in [('Periodic', 'Periodic', 'Periodic', 'Periodic'),
+                ('Periodic', 'Periodic', 'Mirror', '0Moment0Shear'),
+                ('0Slope0Shear', 'Mirror', 'Periodic', 'Periodic')]:
+        w = flexure(qs=qs, **boundary_conditions(*bcs)).w
+        assert np.isfinite(w).all()
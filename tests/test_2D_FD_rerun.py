@@ -0,0 +1,64 @@
+#! /usr/bin/env python
+
+import numpy as np
+
+rng = np.random.RandomState(0)
+Te_grid = 20000. + 10000.*rng.rand(14, 17)
+qs = np.zeros((14, 17))
+qs[3:9, 4:12] += 1E6
+
+# Variable Te, and a different boundary condition on each side
+plate = {'Te': Te_grid, 'qs': qs, 'dy': 7000., 'BC_W': 'Mirror',
+         'BC_E': '0Moment0Shear', 'BC_N': 'Periodic', 'BC_S': 'Periodic'}
+
+def fresh(flexure, **kwargs):
+    return flexure(**dict(plate, **kwargs)).w
+
+def rerun(flexure, first, second):
+    """
+    Runs once with the inputs in "first", then again on the same object
+    after changing the inputs in "second"
+    """
+    flex = flexure(**dict(plate, **first))
+    for key in second:
+        setattr(flex, key, second[key])
+    flex.run()
+    flex.finalize()
+    return flex.w
+
+def assert_same(w, w_ref, rtol=1E-9):
+    np.testing.assert_allclose(w, w_ref, rtol=0, atol=rtol*np.abs(w_ref).max())
+
+def test_rerun_after_changing_Te(flexure):
+    Te_other = 15000. + 20000.*rng.rand(14, 17)
+    for first, second in [(Te_grid, Te_other), (25000., 30000.),
+                          (Te_grid, 30000.), (25000., Te_other)]:
+        assert_same(rerun(flexure, {'Te': first}, {'Te': second}),
+                    fresh(flexure, Te=second))
+
+def test_rerun_after_changing_loads(flexure):
+    qs_other = np.zeros((14, 17))
+    qs_other[7:12, 2:15] += 2E6
+    assert_same(rerun(flexure, {}, {'qs': qs_other}),
+                fresh(flexure, qs=qs_other))
+
+def test_rerun_after_changing_boundary_conditions(flexure):
+    for bcs in [('Periodic', 'Periodic', 'Periodic', 'Periodic'),
+                ('Mirror', '0Slope0Shear', '0Displacement0Slope', 'Mirror'),
+                ('0Moment0Shear', 'Mirror', '0Slope0Shear', '0Moment0Shear')]:
+        second = dict(zip(('BC_W', 'BC_E', 'BC_N', 'BC_S'), bcs))
+        assert_same(rerun(flexure, {}, second), fresh(flexure, **second))
+
+def test_rerun_after_changing_solver(flexure):
+    # Constant Te and clamped edges: a symmetric matrix, which the iterative
+    # solution (conjugate gradients) converges on
+    first = {'Te': 30000., 'BC_W': '0Displacement0Slope',
+             'BC_E': '0Displacement0Slope', 'BC_N': '0Displacement0Slope',
+             'BC_S': '0Displacement0Slope'}
+    second = {'Solver': 'iterative', 'iterative_ConvergenceTolerance': 1E-10}
+    kwargs = dict(first, **second)
+    w = rerun(flexure, first, second)
+    assert_same(w, fresh(flexure, **kwargs))
+    assert_same(w, fresh(flexure, **first), rtol=1E-6)
+    assert_same(rerun(flexure, kwargs, {'Solver': 'direct'}),
+                fresh(flexure, **first))
@@ -0,0 +1,88 @@
+#! /usr/bin/env python
+
+import sys
+import numpy as np
+import scipy.sparse.linalg
+
+rng = np.random.RandomState(0)
+qs = np.zeros((30, 40))
+qs[10:20, 12:30] += 1E6
+
+# Variable Te, and a different boundary condition on each side: a
+# non-symmetric matrix
+plate = {'Te': 20000. + 10000.*rng.rand(30, 40), 'qs': qs, 'dy': 6000.,
+         'BC_W': 'Mirror', 'BC_E': '0Moment0Shear', 'BC_N': 'Periodic',
+         'BC_S': 'Periodic'}
+
+# Constant Te with clamped or periodic edges: symmetric matrices, which the
+# iterative solution solves by conjugate gradients
+symmetric_cases = [
+    {'qs': qs, 'dy': 6000.},
+    {'qs': qs, 'dy': 6000., 'BC_W': 'Periodic', 'BC_E': 'Periodic',
+     'BC_N': 'Periodic', 'BC_S': 'Periodic'},
+    ]
+
+def assert_close(w, w_ref, rtol):
+    np.testing.assert_allclose(w, w_ref, rtol=0, atol=rtol*np.abs(w_ref).max())
+
+def test_direct_solvers_agree(flexure):
+    w_ref = flexure(**plate).w
+    for DirectSolver in ('UMFpack', 'SuperLU'):
+        assert_close(flexure(DirectSolver=DirectSolver, **plate).w, w_ref, 1E-9)
+
+def test_conjugate_gradients_agree_with_direct_solution(flexure):
+    for case in symmetric_cases:
+        w_ref = flexure(**case).w
+        w = flexure(Solver='iterative', iterative_ConvergenceTolerance=1E-10,
+                    **case).w
+        assert_close(w, w_ref, 1E-9)
+
+def test_failed_conjugate_gradients_fall_back_to_lgmres(flexure, monkeypatch):
+    # As when large compressive stresses make the symmetric matrix indefinite
+    def cg(A, b, **kwargs):
+        return np.zeros_like(b), 1
+    monkeypatch.setattr(scipy.sparse.linalg, 'cg', cg)
+    for case in symmetric_cases:
+        w_ref = flexure(**case).w
+        w = flexure(Solver='iterative', iterative_ConvergenceTolerance=1E-10,
+                    **case).w
+        assert_close(w, w_ref, 1E-6)
+
+def test_iterative_solution_uses_the_convergence_tolerance(flexure):
+    for case in symmetric_cases:
+        w_ref = flexure(**case).w
+        error = []
+        for tolerance in (1E-3, 1E-10):
+            w = flexure(Solver='iterative',
+                        iterative_ConvergenceTolerance=tolerance, **case).w
+            error.append(np.abs(w - w_ref).max())
+        assert error[1] < error[0]
+
+def test_single_precision_with_refinement_agrees_with_direct_solution(flexure):
+    for case in symmetric_cases:
+        w_ref = flexure(**case).w
+        w = flexure(Solver='iterative', dtype=np.float32,
+                    iterative_ConvergenceTolerance=1E-8, **case).w
+        assert w.dtype == np.float64
+        assert_close(w, w_ref, 1E-5)
+
+def test_direct_solution_keeps_single_precision_request(flexure):
+    case = symmetric_cases[0]
+    w_ref = flexure(**case).w
+    flex = flexure(dtype=np.float32, iterative_ConvergenceTolerance=1E-8,
+                   **case)
+    assert_close(flex.w, w_ref, 1E-9)
+    assert flex.dtype == np.float32
+    flex.Solver = 'iterative'
+    flex.run()
+    flex.finalize()
+    assert flex._iteration_matrix.dtype == np.float32
+    assert_close(flex.w, w_ref, 1E-5)
+
+def test_multigrid_preconditioner_without_pyamg(flexure, monkeypatch):
+    # If pyamg cannot be imported, the solution is not preconditioned
+    monkeypatch.setitem(sys.modules, 'pyamg', None)
+    for case in symmetric_cases:
+        w_ref = flexure(Solver='iterative', **case).w
+        w = flexure(Solver='iterative', Preconditioner='multigrid', **case).w
+        np.testing.assert_array_equal(w, w_ref)
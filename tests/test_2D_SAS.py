@@ -0,0 +1,87 @@
+#! /usr/bin/env python
+
+import numpy as np
+from scipy.special import kei
+
+# The plate in the flexure fixture
+E = 65E9
+nu = 0.25
+g = 9.8
+rho_m = 3300.
+Te = 30000.
+
+NoOutsideLoads = {'BC_W': 'NoOutsideLoads', 'BC_E': 'NoOutsideLoads',
+                  'BC_N': 'NoOutsideLoads', 'BC_S': 'NoOutsideLoads'}
+
+def unit_load_solution(r):
+    """
+    Deflection at distance r from a unit point load, summed directly
+    """
+    D = E*Te**3/(12*(1-nu**2))
+    alpha = (D/(rho_m*g))**.25
+    return alpha**2/(2*np.pi*D) * kei(r/alpha)
+
+def superposition(qs, dx, dy):
+    """
+    Deflection under the gridded loads qs, summed directly from the
+    point-load solution
+    """
+    ny, nx = qs.shape
+    y, x = np.mgrid[:ny, :nx]
+    w = np.zeros((ny, nx))
+    for j, i in zip(*np.nonzero(qs)):
+        r = np.hypot((x - i)*dx, (y - j)*dy)
+        w += qs[j, i]*dx*dy * unit_load_solution(r)
+    return w
+
+def check_gridded_superposition(flexure, ny, nx, dx, dy):
+    # Few loads are summed one by one and many are convolved by FFT: both
+    # must give the superposition of the point-load solutions. The corner
+    # loads reach the far edges of the unit-load grid
+    rng = np.random.RandomState(0)
+    for nloads in (3, ny*nx):
+        qs = np.zeros((ny, nx))
+        qs.flat[rng.permutation(ny*nx)[:nloads]] = 1E6*rng.rand(nloads)
+        qs[0, 0] = qs[-1, -1] = 1E6
+        w_ref = superposition(qs, dx, dy)
+        w = flexure(Method='SAS', qs=qs, dx=dx, dy=dy, **NoOutsideLoads).w
+        np.testing.assert_allclose(w, w_ref, rtol=0, atol=1E-9*np.abs(w_ref).max())
+
+def test_gridded_superposition(flexure):
+    check_gridded_superposition(flexure, 12, 15, 5000., 7000.)
+
+def test_gridded_superposition_square_cells(flexure):
+    # Square cells take the octant evaluation of the unit-load solution: on
+    # square grids, and on wide and tall ones, of odd and even sizes
+    for ny, nx in ((12, 12), (13, 13), (11, 16), (16, 11), (10, 7)):
+        check_gridded_superposition(flexure, ny, nx, 6000., 6000.)
+
+def ungridded(flexure, q0, xw, yw, latlon):
+    return flexure(Method='SAS_NG', x=q0[:,0], y=q0[:,1], q=q0[:,2], xw=xw,
+                   yw=yw, latlon=latlon, PlanetaryRadius=6371000.,
+                   **NoOutsideLoads).w
+
+def test_ungridded_latlon_counts_each_load_once(flexure):
+    # Point loads [lon, lat, q], and output points
+    q0 = np.array([[40., 75., 1E15], [45., 78., 5E14], [50., 80., 0.]])
+    xw = np.linspace(30., 60., 7)
+    yw = np.linspace(70., 85., 7)
+    w = ungridded(flexure, q0, xw, yw, latlon=True)
+    w_ref = np.zeros(xw.shape)
+    for lon, lat, q in q0:
+        phi1, phi2 = np.radians(lat), np.radians(yw)
+        cos_arc = np.sin(phi1)*np.sin(phi2) \
+                + np.cos(phi1)*np.cos(phi2)*np.cos(np.radians(xw - lon))
+        r = 6371000. * np.arccos(np.clip(cos_arc, -1, 1))
+        w_ref += q * unit_load_solution(r)
+    np.testing.assert_allclose(w, w_ref, rtol=1E-9)
+
+def test_ungridded_cartesian(flexure):
+    q0 = np.array([[0., 0., 1E15], [50000., 20000., 5E14]])
+    xw = np.linspace(-100000., 100000., 9)
+    yw = np.linspace(-50000., 80000., 9)
+    w = ungridded(flexure, q0, xw, yw, latlon=False)
+    w_ref = np.zeros(xw.shape)
+    for x, y, q in q0:
+        w_ref += q * unit_load_solution(np.hypot(xw - x, yw - y))
+    np.testing.assert_allclose(w, w_ref, rtol=1E-9)
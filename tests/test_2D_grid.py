@@ -0,0 +1,16 @@
+#! /usr/bin/env python
+
+import numpy as np
+
+def test_cell_centers_on_non_square_grid(flexure):
+    # qs is (ny, nx): x runs along its columns and y along its rows
+    ny, nx = 6, 9
+    dx, dy = 5000., 7000.
+    qs = np.zeros((ny, nx))
+    qs[2:4, 3:6] += 1E6
+    for Method, BC in (('FD', '0Displacement0Slope'), ('SAS', 'NoOutsideLoads')):
+        flex = flexure(Method=Method, qs=qs, dx=dx, dy=dy,
+                       BC_W=BC, BC_E=BC, BC_N=BC, BC_S=BC)
+        np.testing.assert_allclose(flex.x, (np.arange(nx) + 0.5) * dx)
+        np.testing.assert_allclose(flex.y, (np.arange(ny) + 0.5) * dy)
+        assert flex.w.shape == (ny, nx)